@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+STATUS CLASSIFIER BENCHMARK
+- Labelled corpus of real-looking task replies
+- Compares accuracy + throughput of the compiled classifier against the
+  old nested substring loop
+
+Usage: python bench_status_classifier.py [repeat]
+"""
+
+import sys
+import time
+
+from status_classifier import KEYWORDS, MIN_CONFIDENCE, classify_status
+
+QUOTED = """
+
+On Mon, 12 Oct 2026 at 10:02, MoM Automation <mom@koenig-solutions.com> wrote:
+> New MoM Task Assigned: Vendor onboarding
+> Status: pending. Please reply once the task is completed or if it is delayed / on hold.
+"""
+
+OUTLOOK_QUOTED = """
+________________________________
+From: MoM Automation <mom@koenig-solutions.com>
+Sent: Monday, October 12, 2026 10:02 AM
+Subject: New MoM Task Assigned: Vendor onboarding
+
+Please reply once this is done. Let us know if it is on hold or delayed.
+"""
+
+# (reply body, expected status)
+CORPUS = [
+    ("Hi, I have started working on this and will share an update by Friday.", 'in_progress'),
+    ("Working on it.", 'in_progress'),
+    ("This is in progress, the first draft is ready.", 'in_progress'),
+    ("I'm working with the vendor on the contract.", 'in_progress'),
+    ("We have begun the migration, about 40% through.", 'in_progress'),
+    ("Not completed yet, still working on the last section.", 'in_progress'),
+    ("Not started yet, but I am working on the prerequisites.", 'in_progress'),
+    ("Task completed. Report attached.", 'completed'),
+    ("Done!", 'completed'),
+    ("The issue has been resolved and the ticket is closed.", 'completed'),
+    ("Finished the analysis, sharing the sheet now.", 'completed'),
+    ("All invoices delivered to finance today.", 'completed'),
+    ("Hi team, this is complete from my side.", 'completed'),
+    ("Completed, no further delay expected on the follow-up items.", 'completed'),
+    ("Sorry, this is delayed because the data arrived late.", 'delayed'),
+    ("I need more time for this, can we move the deadline to next week?", 'delayed'),
+    ("We are running late on this one, expect it Monday.", 'delayed'),
+    ("Cannot complete by the deadline, extension needed.", 'delayed'),
+    ("Slightly behind schedule due to the audit.", 'delayed'),
+    ("This task is on hold until the budget is approved.", 'on_hold'),
+    ("On hold until done with the audit.", 'on_hold'),
+    ("Waiting for the client's sign-off before I can proceed.", 'on_hold'),
+    ("Blocked by IT - access request is still pending approval.", 'on_hold'),
+    ("Paused for now, awaiting inputs from sales.", 'on_hold'),
+    ("There is a dependency on the HR team, so I have put it on hold.", 'on_hold'),
+    ("Thanks for the reminder.", None),
+    ("Noted, will check and revert.", None),
+    ("Please call me to discuss.", None),
+    ("Started working on it." + QUOTED, 'in_progress'),
+    ("Completed as discussed." + OUTLOOK_QUOTED, 'completed'),
+    ("Hi, quick question about the scope." + QUOTED, None),
+    ("We are on hold, waiting for legal." + OUTLOOK_QUOTED, 'on_hold'),
+]
+
+
+def legacy_detect(body):
+    """The original detect_status_from_content (first substring hit in dict order)"""
+    body_lower = body.lower()
+    for status, keywords in KEYWORDS.items():
+        for keyword in keywords:
+            if keyword in body_lower:
+                return status
+    return None
+
+
+def compiled_detect(body):
+    status, confidence = classify_status(body)
+    return status if confidence >= MIN_CONFIDENCE else None
+
+
+def evaluate(name, detect, repeat):
+    misses = [(body, expected, detect(body)) for body, expected in CORPUS if detect(body) != expected]
+    accuracy = 1 - len(misses) / len(CORPUS)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for body, _expected in CORPUS:
+            detect(body)
+    elapsed = time.perf_counter() - start
+    rate = repeat * len(CORPUS) / elapsed
+
+    print(f"{name:<10} accuracy {accuracy:6.1%}   {rate:>10,.0f} replies/s")
+    for body, expected, got in misses:
+        print(f"    ✗ expected {expected!s:<12} got {got!s:<12} {body.strip().splitlines()[0][:60]}")
+
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"Corpus: {len(CORPUS)} replies × {repeat}")
+    evaluate("legacy", legacy_detect, repeat)
+    evaluate("compiled", compiled_detect, repeat)
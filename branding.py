@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+BRANDING ASSETS
+- The logo is resolved once to a local file: branding.logo_file
+  (assets/koenig-logo.png), downloaded from branding.logo_url only if
+  that file is missing
+- The decoded ImageReader is kept in memory and shared by every PDF
+  drawn in the process
+"""
+
+import os
+import urllib.request
+
+import yaml
+from reportlab.lib.utils import ImageReader
+
+# ---------------------------------------------------------
+# Load config
+# ---------------------------------------------------------
+with open("config.yaml", "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+
+LOGO_URL = config["branding"].get("logo_url", "")
+LOGO_FILE = config["branding"].get("logo_file", "assets/koenig-logo.png")
+
+_logo = None
+_logo_failed = False
+
+
+def logo_path():
+    """Local path of the logo (downloaded once if missing), or None"""
+    if os.path.exists(LOGO_FILE):
+        return LOGO_FILE
+    if not LOGO_URL:
+        return None
+    try:
+        os.makedirs(os.path.dirname(LOGO_FILE) or ".", exist_ok=True)
+        tmp = LOGO_FILE + ".part"
+        with urllib.request.urlopen(LOGO_URL, timeout=10) as response, open(tmp, "wb") as f:
+            f.write(response.read())
+        os.replace(tmp, LOGO_FILE)
+        return LOGO_FILE
+    except Exception as e:
+        print(f"⚠️  Logo download failed: {e}")
+        return None
+
+
+def get_logo():
+    """Shared ImageReader for the logo, or None if it is unavailable"""
+    global _logo, _logo_failed
+    if _logo is None and not _logo_failed:
+        path = logo_path()
+        try:
+            _logo = ImageReader(path) if path else None
+        except Exception as e:
+            print(f"⚠️  Logo unreadable ({path}): {e}")
+            _logo = None
+        _logo_failed = _logo is None
+    return _logo
+
+
+def draw_logo(c, x, y, width, **kwargs):
+    """Draw the logo on canvas `c` (no-op without a logo); returns True if drawn"""
+    logo = get_logo()
+    if logo is None:
+        return False
+    c.drawImage(logo, x, y, width=width, **kwargs)
+    return True
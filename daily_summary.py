@@ -1,8 +1,8 @@
-import pandas as pd
 import os
 import yaml
 from datetime import datetime
-from email_engine import send_email
+from mail_queue import MailQueue
+from task_cube import get_cube
 
 with open("config.yaml", "r") as f:
     config = yaml.safe_load(f)
@@ -11,12 +11,8 @@ MOM_FILE = config["paths"]["mom_file"]
 OWNER_EMAIL = os.getenv("TEST_EMAIL")
 
 def send_daily_summary():
-    df = pd.read_excel(MOM_FILE, sheet_name="Tasks")
-
-    total = len(df)
-    pending = len(df[df["Status"] == "pending"])
-    completed = len(df[df["Status"] == "completed"])
-    overdue = len(df[(df["Status"] == "pending") & (pd.to_datetime(df["Deadline"]) < datetime.today())])
+    stats = get_cube().summary()
+    pending, completed, overdue = stats["pending"], stats["completed"], stats["overdue"]
 
     today = datetime.today().strftime("%Y-%m-%d")
 
@@ -28,13 +24,15 @@ def send_daily_summary():
 🔥 Overdue: {overdue}
 """
 
-    send_email(
+    queue = MailQueue()
+    queue.enqueue(
         OWNER_EMAIL,
         f"Daily MoM Summary – {today}",
         body
     )
 
-    print("✅ Daily summary email sent")
+    if all(r["sent"] for r in queue.flush()):
+        print("✅ Daily summary email sent")
 
 if __name__ == "__main__":
     send_daily_summary()
@@ -1,12 +1,18 @@
 # email_engine.py - WITH TEAM EMAIL YAML
 
 import smtplib
+import socket
 import os
+import time
+import atexit
+import threading
 import yaml
+from contextlib import contextmanager
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from dotenv import load_dotenv
 from pathlib import Path
+from task_token import tag_message
 
 # ✅ LOAD ENV EXPLICITLY
 load_dotenv(dotenv_path=".env")
@@ -74,7 +80,231 @@ def get_email_address(recipient):
     return OWNER_EMAIL
 
 
-def send_email(to_recipient, subject, body):
+def _load_pool_settings():
+    """SMTP pool tuning from config.yaml (email.smtp_pool)"""
+    try:
+        with open("config.yaml", "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+        return config.get("email", {}).get("smtp_pool", {}) or {}
+    except Exception:
+        return {}
+
+POOL_SETTINGS = _load_pool_settings()
+
+
+def _smtp_settings():
+    """Read SMTP settings from ENV, raising if any are missing"""
+    settings = {
+        "server": os.getenv("SMTP_SERVER"),
+        "port": int(os.getenv("SMTP_PORT", "587")),
+        "user": os.getenv("SMTP_USER"),
+        "password": os.getenv("SMTP_PASS"),
+    }
+    if not all(settings.values()):
+        raise ValueError("SMTP ENV variables missing")
+    return settings
+
+
+def build_message(sender, to_email, subject, body, task_id=None):
+    """Plain-text MIME message (tagged with the task token if task_id is given)"""
+    msg = MIMEMultipart()
+    msg["From"] = sender
+    msg["To"] = to_email
+    msg["Subject"] = subject
+    msg.attach(MIMEText(body, "plain"))
+    if task_id:
+        tag_message(msg, task_id)
+    return msg
+
+
+# ✅ REUSABLE SMTP SESSION
+class SMTPSession:
+    """
+    One logged-in SMTP connection reused across messages
+    
+    - Connects lazily on first send
+    - Sends NOOP after keepalive_seconds idle, reconnecting if it fails
+    - Reconnects after max_messages (provider per-connection limits)
+    - Retries a message once on 421 / disconnect / timeout
+    
+    Point it at a local stand-in (aiosmtpd / smtpd) with
+    starttls=False and no user to test without a real server.
+    """
+
+    def __init__(self, server, port, user=None, password=None, starttls=True,
+                 timeout=30, max_messages=50, keepalive_seconds=60):
+        self.server = server
+        self.port = port
+        self.user = user
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.max_messages = max_messages
+        self.keepalive_seconds = keepalive_seconds
+        self.connection = None
+        self.sent_on_connection = 0
+        self.last_used = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def connect(self):
+        self.close()
+        conn = smtplib.SMTP(self.server, self.port, timeout=self.timeout)
+        if self.starttls:
+            conn.starttls()
+        if self.user:
+            conn.login(self.user, self.password)
+        self.connection = conn
+        self.sent_on_connection = 0
+        self.last_used = time.monotonic()
+
+    def close(self):
+        if self.connection is None:
+            return
+        try:
+            self.connection.quit()
+        except Exception:
+            try:
+                self.connection.close()
+            except Exception:
+                pass
+        self.connection = None
+
+    def _ensure_connected(self):
+        if self.connection is None or self.sent_on_connection >= self.max_messages:
+            self.connect()
+            return
+
+        if time.monotonic() - self.last_used < self.keepalive_seconds:
+            return
+
+        # Idle connection: check it is still alive
+        try:
+            code, _ = self.connection.noop()
+            if code != 250:
+                self.connect()
+        except (smtplib.SMTPException, OSError):
+            self.connect()
+
+    def send(self, msg):
+        """Send an email.message.Message, reconnecting once on a dropped session"""
+        self._ensure_connected()
+        try:
+            self.connection.send_message(msg)
+        except (smtplib.SMTPServerDisconnected, socket.timeout, ConnectionError) as e:
+            print(f"ℹ️  SMTP session dropped ({e}), reconnecting")
+            self.connect()
+            self.connection.send_message(msg)
+        except smtplib.SMTPResponseException as e:
+            if e.smtp_code != 421:
+                raise
+            print("ℹ️  SMTP 421 (service closing), reconnecting")
+            self.connect()
+            self.connection.send_message(msg)
+
+        self.sent_on_connection += 1
+        self.last_used = time.monotonic()
+
+
+# ✅ SHARED SESSION POOL
+class SMTPPool:
+    """Thread-safe pool of SMTPSession objects shared by all senders"""
+
+    def __init__(self, settings, max_connections=2, **session_options):
+        self.settings = settings
+        self.max_connections = max_connections
+        self.session_options = session_options
+        self._idle = []
+        self._created = 0
+        self._lock = threading.Condition()
+
+    def _new_session(self):
+        return SMTPSession(
+            self.settings["server"],
+            self.settings["port"],
+            user=self.settings.get("user"),
+            password=self.settings.get("password"),
+            **self.session_options
+        )
+
+    @contextmanager
+    def session(self):
+        """Borrow a session; it goes back to the pool afterwards"""
+        with self._lock:
+            while not self._idle and self._created >= self.max_connections:
+                self._lock.wait()
+            if self._idle:
+                session = self._idle.pop()
+            else:
+                session = self._new_session()
+                self._created += 1
+        try:
+            yield session
+        except Exception:
+            # Don't hand a possibly broken connection to the next sender
+            session.close()
+            raise
+        finally:
+            with self._lock:
+                self._idle.append(session)
+                self._lock.notify()
+
+    def close_all(self):
+        with self._lock:
+            for session in self._idle:
+                session.close()
+
+
+def create_session():
+    """New SMTPSession from ENV + config email.smtp_pool (not pooled)"""
+    settings = _smtp_settings()
+    return SMTPSession(
+        settings["server"],
+        settings["port"],
+        user=settings["user"],
+        password=settings["password"],
+        **_session_options()
+    )
+
+
+def _session_options():
+    return {
+        "max_messages": int(POOL_SETTINGS.get("max_messages_per_connection", 50)),
+        "keepalive_seconds": int(POOL_SETTINGS.get("keepalive_seconds", 60)),
+        "timeout": int(POOL_SETTINGS.get("timeout_seconds", 30)),
+    }
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_smtp_pool():
+    """Process-wide SMTP pool built from ENV + config email.smtp_pool"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SMTPPool(
+                _smtp_settings(),
+                max_connections=int(POOL_SETTINGS.get("max_connections", 2)),
+                **_session_options()
+            )
+            atexit.register(_pool.close_all)
+        return _pool
+
+
+def send_message(msg):
+    """Send a ready-built MIME message through the shared pool"""
+    with get_smtp_pool().session() as session:
+        session.send(msg)
+
+
+def send_email(to_recipient, subject, body, task_id=None):
     """
     Send email - accepts name or email address
     
@@ -82,33 +312,19 @@ def send_email(to_recipient, subject, body):
         to_recipient: Name (e.g. "Sunil") or email
         subject: Email subject
         body: Email body
+        task_id: TaskID to tag the mail with (subject token + headers)
     
     Returns:
         bool: True if sent, False if failed
     """
     try:
-        SMTP_SERVER = os.getenv("SMTP_SERVER")
-        SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
-        SMTP_USER = os.getenv("SMTP_USER")
-        SMTP_PASS = os.getenv("SMTP_PASS")
-
-        if not all([SMTP_SERVER, SMTP_PORT, SMTP_USER, SMTP_PASS]):
-            raise ValueError("SMTP ENV variables missing")
+        settings = _smtp_settings()
         
         # ✅ CONVERT NAME TO EMAIL
         to_email = get_email_address(to_recipient)
 
-        msg = MIMEMultipart()
-        msg["From"] = SMTP_USER
-        msg["To"] = to_email
-        msg["Subject"] = subject
-        msg.attach(MIMEText(body, "plain"))
-
-        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
-        server.starttls()
-        server.login(SMTP_USER, SMTP_PASS)
-        server.send_message(msg)
-        server.quit()
+        msg = build_message(settings["user"], to_email, subject, body, task_id=task_id)
+        send_message(msg)
 
         print(f"✅ Email sent to {to_email} ({to_recipient})")
         return True
@@ -120,6 +336,41 @@ def send_email(to_recipient, subject, body):
         return False
 
 
+def send_emails(messages):
+    """
+    Send several emails over one pooled SMTP session
+    
+    Args:
+        messages: list of (to_recipient, subject, body) or
+                  (to_recipient, subject, body, task_id) tuples
+    
+    Returns:
+        list[bool]: one result per message, in order
+    """
+    results = [False] * len(messages)
+    if not messages:
+        return results
+
+    try:
+        settings = _smtp_settings()
+        pool = get_smtp_pool()
+    except Exception as e:
+        print(f"❌ Batch email failed ({len(messages)} message(s)): {e}")
+        return results
+
+    with pool.session() as session:
+        for i, (to_recipient, subject, body, *task_id) in enumerate(messages):
+            try:
+                to_email = get_email_address(to_recipient)
+                session.send(build_message(settings["user"], to_email, subject, body, *task_id))
+                results[i] = True
+                print(f"✅ Email sent to {to_email} ({to_recipient})")
+            except Exception as e:
+                print(f"❌ Email failed to {to_recipient}: {e}")
+
+    return results
+
+
 # ✅ TEST FUNCTION
 if __name__ == "__main__":
     print("=" * 70)
@@ -5,7 +5,7 @@ COMPLETE EMAIL REPLY PROCESSOR
 - Detects keywords: "working", "completed", "delayed", "on hold"
 - Updates task status in Excel
 - Sends smart auto-acknowledgement emails
-- Logs all actions
+- Logs every status change (with the reply as notes) to the task event log
 """
 
 import os
@@ -13,12 +13,19 @@ import re
 import imaplib
 import email
 from email.header import decode_header
-from datetime import datetime
-import pandas as pd
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import email.parser
+from collections import defaultdict
+from datetime import datetime, timedelta
 import yaml
+from task_store import get_task_store
+from task_log import TaskLog
+from email_engine import build_message, send_message
+from mail_queue import MailQueue
+from imap_checkpoint import ImapCheckpoint
+from title_index import TitleIndex, strip_reply_prefixes
+from imap_mime import decode_text_part, extract_bodystructure, parse_bodystructure, select_text_part
+from task_token import is_task_mail, strip_subject_token, task_id_from_headers, task_id_from_subject
+from status_classifier import MIN_CONFIDENCE, classify_status
 
 # Load configuration
 with open('config.yaml', 'r') as f:
@@ -33,32 +40,28 @@ SMTP_PASS = os.getenv('SMTP_PASS')
 SMTP_SERVER = os.getenv('SMTP_SERVER', 'smtp.office365.com')
 SMTP_PORT = int(os.getenv('SMTP_PORT', '587'))
 
-# Keyword detection patterns
-KEYWORDS = {
-    'in_progress': [
-        'working on', 'started', 'in progress', 'begun', 'working',
-        'i am working', "i'm working", 'started working'
-    ],
-    'completed': [
-        'completed', 'done', 'finished', 'complete', 'closed',
-        'resolved', 'accomplished', 'delivered'
-    ],
-    'delayed': [
-        'delayed', 'delay', 'need more time', 'extension needed',
-        'cannot complete', 'running late', 'behind schedule'
-    ],
-    'on_hold': [
-        'on hold', 'hold', 'waiting for', 'dependency', 'blocked',
-        'paused', 'pending approval', 'awaiting'
-    ]
+# Inbox settings
+IMAP_CONFIG = config.get('imap', {})
+IMAP_SERVER = IMAP_CONFIG.get('server', 'outlook.office365.com')
+MAILBOX = IMAP_CONFIG.get('mailbox', 'INBOX')
+BATCH_SIZE = int(IMAP_CONFIG.get('batch_size', 50))
+BOOTSTRAP_DAYS = int(IMAP_CONFIG.get('bootstrap_days', 7))
+MAX_BODY_BYTES = int(IMAP_CONFIG.get('max_body_bytes', 65536))
+
+# Detected keyword category → task Status
+STATUS_MAP = {
+    'in_progress': 'in-progress',
+    'completed': 'completed',
+    'delayed': 'delayed',
+    'on_hold': 'on-hold'
 }
 
 def connect_to_inbox():
     """Connect to Outlook/Office365 inbox via IMAP"""
     try:
-        mail = imaplib.IMAP4_SSL('outlook.office365.com')
+        mail = imaplib.IMAP4_SSL(IMAP_SERVER)
         mail.login(SMTP_USER, SMTP_PASS)
-        mail.select('INBOX')
+        mail.select(MAILBOX)
         print(f"✅ Connected to inbox: {SMTP_USER}")
         return mail
     except Exception as e:
@@ -66,103 +69,142 @@ def connect_to_inbox():
         return None
 
 def extract_task_id(subject):
-    """Extract TaskID from email subject like 'Re: New MoM Task Assigned: Task Title' or '[Task-#123]'"""
-    # Pattern 1: [Task-#123]
-    match = re.search(r'\[Task-#?(\d+)\]', subject, re.IGNORECASE)
-    if match:
-        return int(match.group(1))
-    
-    # Pattern 2: Try to find task by matching subject with task titles in Excel
-    # This is a fallback - we'll search Excel for matching title
-    return None
-
-def detect_status_from_content(body):
-    """Detect intended status from email body content"""
-    body_lower = body.lower()
-    
-    # Check each category
-    for status, keywords in KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in body_lower:
-                return status
-    
-    return None
+    """Extract TaskID from a subject token like '[MoM:TASK-1A2B3C4D]' (or legacy '[Task-#123]')"""
+    return task_id_from_subject(subject)
+
+def detect_status_from_content(body, min_confidence=MIN_CONFIDENCE):
+    """Detect intended status from email body content (None if unsure)"""
+    status, confidence = classify_status(body)
+    if status and confidence < min_confidence:
+        print(f"⚠️  Low confidence ({confidence:.2f}) for status '{status}' - ignored")
+        return None
+    return status
 
 def get_task_by_id(task_id):
     """Get task details from Excel by TaskID"""
     try:
-        df = pd.read_excel(MOM_FILE, sheet_name='Tasks')
-        task = df[df['TaskID'] == task_id]
-        if not task.empty:
-            return task.iloc[0].to_dict()
-        return None
+        return get_task_store().get_task(task_id)
     except Exception as e:
         print(f"❌ Error reading task {task_id}: {e}")
         return None
 
-def get_task_by_title_match(subject):
-    """Find task by matching subject with task titles"""
+def title_from_subject(subject):
+    """Task title quoted in a reply subject ('Re: New MoM Task Assigned: TITLE'), or None"""
+    subject = strip_subject_token(strip_reply_prefixes(subject))
+    match = re.search(r'New MoM Task Assigned:\s*(.+)$', subject, re.IGNORECASE)
+    return match.group(1).strip() if match else None
+
+def get_task_by_title_match(subject, tasks=None, index=None):
+    """
+    Find task by matching subject with task titles
+    
+    `tasks` / `index` let a run reuse one task table and TitleIndex for
+    every email instead of rebuilding them per message.
+    """
     try:
-        df = pd.read_excel(MOM_FILE, sheet_name='Tasks')
-        
-        # Clean subject - remove Re:, Fwd:, etc.
-        clean_subject = re.sub(r'^(Re:|Fwd:|RE:|FW:)\s*', '', subject, flags=re.IGNORECASE).strip()
+        task_title = title_from_subject(subject)
+        if not task_title:
+            return None
         
-        # Try to extract task title from subject
-        # Pattern: "New MoM Task Assigned: TASK TITLE"
-        match = re.search(r'New MoM Task Assigned:\s*(.+)$', clean_subject, re.IGNORECASE)
-        if match:
-            task_title = match.group(1).strip()
-            
-            # Find matching task
-            for idx, row in df.iterrows():
-                if str(row['Title']).strip().lower() == task_title.lower():
-                    return row.to_dict()
+        df = get_task_store().load_tasks() if tasks is None else tasks
+        index = index or TitleIndex(df)
         
-        return None
+        # Exact (normalized) title first, trigram similarity as fallback
+        task_id = index.match(task_title)
+        if task_id is None:
+            return None
+        matches = df[df['TaskID'].astype(str) == task_id]
+        return matches.iloc[0].to_dict() if not matches.empty else None
     except Exception as e:
         print(f"❌ Error matching task by title: {e}")
         return None
 
-def update_task_status(task_id, new_status, update_notes=''):
-    """Update task status in Excel"""
+def _status_fields(new_status):
+    """Columns written for a status change"""
+    return {
+        'Status': STATUS_MAP.get(new_status, 'pending'),
+        'LastUpdateDate': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+def _status_event(task_id, new_status, update_notes='', actor=None):
+    """Task log event for a status change (notes go to the log, not Details)"""
+    return {
+        'TaskID': task_id,
+        'Action': 'status',
+        'Actor': actor,
+        'Fields': _status_fields(new_status),
+        'Notes': update_notes,
+    }
+
+def update_task_status(task_id, new_status, update_notes='', actor=None):
+    """Journal a status change and fold it into the task store"""
     try:
-        df = pd.read_excel(MOM_FILE, sheet_name='Tasks')
-        
-        # Find task
-        task_idx = df[df['TaskID'] == task_id].index
-        if len(task_idx) == 0:
-            print(f"⚠️  Task #{task_id} not found in Excel")
+        store = get_task_store()
+        if store.get_task(task_id) is None:
+            print(f"⚠️  Task #{task_id} not found in store")
             return False
         
-        # Update status
-        status_map = {
-            'in_progress': 'in-progress',
-            'completed': 'completed',
-            'delayed': 'delayed',
-            'on_hold': 'on-hold'
-        }
-        
-        df.loc[task_idx, 'Status'] = status_map.get(new_status, 'pending')
-        df.loc[task_idx, 'LastUpdateDate'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        if update_notes:
-            current_notes = str(df.loc[task_idx, 'Details'].values[0])
-            df.loc[task_idx, 'Details'] = f"{current_notes}\n\n[Update {datetime.now().strftime('%Y-%m-%d')}]: {update_notes}"
-        
-        # Save back to Excel
-        with pd.ExcelWriter(MOM_FILE, engine='openpyxl', mode='a', if_sheet_exists='overlay') as writer:
-            df.to_excel(writer, sheet_name='Tasks', index=False)
+        log = TaskLog()
+        log.append([_status_event(task_id, new_status, update_notes, actor)])
+        log.compact(store)
         
-        print(f"✅ Updated Task #{task_id} → {status_map.get(new_status)}")
+        print(f"✅ Updated Task #{task_id} → {STATUS_MAP.get(new_status)}")
         return True
         
     except Exception as e:
         print(f"❌ Failed to update task #{task_id}: {e}")
         return False
 
-def send_acknowledgement_email(to_email, task, detected_status, original_reply):
-    """Send smart auto-acknowledgement based on detected status"""
+class TaskUpdateBatch:
+    """
+    Task table loaded once per run; status changes are held in memory,
+    journaled by commit() and folded into the store in a single write
+    """
+    
+    def __init__(self, store=None, log=None):
+        self.store = store or get_task_store()
+        self.log = log or TaskLog()
+        self.tasks = self.store.load_tasks()
+        self._by_id = {str(row['TaskID']): row for row in self.tasks.to_dict('records')}
+        self.titles = TitleIndex(self.tasks)
+        self.pending = {}
+        self.events = []
+    
+    def get(self, task_id):
+        """Task dict (including uncommitted changes) or None"""
+        task = self._by_id.get(str(task_id))
+        if task is None:
+            return None
+        return {**task, **self.pending.get(str(task_id), {})}
+    
+    def match_title(self, subject):
+        """Task whose title is quoted in `subject` (exact, then fuzzy), or None"""
+        task_title = title_from_subject(subject)
+        task_id = self.titles.match(task_title) if task_title else None
+        return self.get(task_id) if task_id is not None else None
+    
+    def set_status(self, task_id, new_status, update_notes='', actor=None):
+        """Record a status change (nothing is written until commit)"""
+        if self.get(task_id) is None:
+            print(f"⚠️  Task #{task_id} not found in store")
+            return False
+        event = _status_event(str(task_id), new_status, update_notes, actor)
+        self.pending.setdefault(str(task_id), {}).update(event['Fields'])
+        self.events.append(event)
+        print(f"✅ Updated Task #{task_id} → {STATUS_MAP.get(new_status)} (pending commit)")
+        return True
+    
+    def commit(self):
+        """Journal every pending change, then compact them into the store at once"""
+        if not self.events:
+            return 0
+        self.log.append(self.events)
+        self.pending = {}
+        self.events = []
+        return self.log.compact(self.store)
+
+def send_acknowledgement_email(to_email, task, detected_status, original_reply, queue=None):
+    """Send smart auto-acknowledgement based on detected status (or queue it)"""
     
     status_templates = {
         'in_progress': {
@@ -265,19 +307,15 @@ Koenig MoM Automation Team
         return False
     
     try:
-        msg = MIMEMultipart()
-        msg['From'] = SMTP_USER
-        msg['To'] = to_email
-        msg['Subject'] = template['subject']
+        msg = build_message(SMTP_USER, to_email, template['subject'], template['body'], task_id=task.get('TaskID'))
         
-        msg.attach(MIMEText(template['body'], 'plain'))
+        if queue is not None:
+            queue.enqueue_message(msg)
+            print(f"📥 Queued acknowledgement to {to_email}")
+            return True
         
-        # Send email
-        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
-        server.starttls()
-        server.login(SMTP_USER, SMTP_PASS)
-        server.send_message(msg)
-        server.quit()
+        # Send email over the shared SMTP pool
+        send_message(msg)
         
         print(f"✅ Sent acknowledgement to {to_email}")
         return True
@@ -286,8 +324,216 @@ Koenig MoM Automation Team
         print(f"❌ Failed to send acknowledgement: {e}")
         return False
 
+def get_uidvalidity(mail, mailbox=MAILBOX):
+    """UIDVALIDITY of the mailbox (UIDs are only comparable while it is unchanged)"""
+    typ, data = mail.status(mailbox, '(UIDVALIDITY)')
+    match = re.search(rb'UIDVALIDITY (\d+)', data[0] if data else b'')
+    return int(match.group(1)) if match else 0
+
+def search_new_uids(mail, last_uid):
+    """UIDs above the checkpoint (no checkpoint: unread mail of the last bootstrap_days)"""
+    if last_uid:
+        typ, data = mail.uid('SEARCH', None, f'UID {last_uid + 1}:*')
+    else:
+        since = (datetime.now() - timedelta(days=BOOTSTRAP_DAYS)).strftime('%d-%b-%Y')
+        typ, data = mail.uid('SEARCH', None, f'UNSEEN SINCE {since}')
+    uids = [int(u) for u in (data[0] or b'').split()] if data else []
+    # "n:*" always matches the newest message, even when it is <= last_uid
+    return sorted(u for u in uids if u > last_uid)
+
+def mark_seen(mail, uids):
+    """Set \\Seen on processed mail, so a run without a checkpoint skips it"""
+    uids = sorted(uids)
+    try:
+        for i in range(0, len(uids), BATCH_SIZE):
+            chunk = ','.join(str(u) for u in uids[i:i + BATCH_SIZE])
+            mail.uid('STORE', chunk, '+FLAGS', '(\\Seen)')
+    except Exception as e:
+        print(f"⚠️  Could not mark {len(uids)} email(s) as read: {e}")
+
+def _parse_fetch_response(data):
+    """imaplib FETCH response → {uid: {section: bytes, 'BODYSTRUCTURE': bytes}}"""
+    messages = {}
+    current = {}
+    meta = []
+
+    def flush():
+        raw = b''.join(meta)
+        uid = re.search(rb'UID (\d+)', raw)
+        if uid:
+            structure = extract_bodystructure(raw)
+            if structure:
+                current['BODYSTRUCTURE'] = structure
+            messages[int(uid.group(1))] = dict(current)
+        current.clear()
+        meta.clear()
+
+    for item in data or []:
+        prefix = item[0] if isinstance(item, tuple) else item
+        if not isinstance(prefix, bytes):
+            continue
+        if re.match(rb'^\d+ \(', prefix):
+            flush()
+        if not isinstance(item, tuple):
+            meta.append(prefix)
+            continue
+        literal_spec = re.search(rb'\{\d+\}$', prefix)
+        meta.append(prefix[:literal_spec.start()] if literal_spec else prefix)
+        sections = re.findall(rb'BODY\[([^\]]*)\](?:<\d+>)?\s*\{\d+\}$', prefix)
+        if sections:
+            current[sections[-1].decode()] = item[1]
+        else:
+            # Literal inside BODYSTRUCTURE (e.g. an odd filename) - keep it quoted
+            meta.append(b'"' + item[1].replace(b'\\', b'\\\\').replace(b'"', b'\\"') + b'"')
+    flush()
+    return messages
+
+def fetch_sections(mail, uids, items):
+    """UID FETCH `items` for a batch of UIDs in one round trip"""
+    if not uids:
+        return {}
+    typ, data = mail.uid('FETCH', ','.join(str(u) for u in uids), f'(UID {items})')
+    return _parse_fetch_response(data)
+
+def _header_part(header):
+    """Text part description for a message whose BODYSTRUCTURE is unavailable"""
+    if header.get_content_maintype() not in ('text', ''):
+        return None
+    return {
+        'section': 'TEXT',
+        'type': 'text',
+        'subtype': header.get_content_subtype(),
+        'charset': header.get_content_charset(),
+        'encoding': str(header.get('Content-Transfer-Encoding') or '7bit').strip().lower(),
+    }
+
+def fetch_text_bodies(mail, parts):
+    """
+    {uid: part} → {uid: decoded text}, fetching only the chosen part of
+    each message and at most MAX_BODY_BYTES of it (one round trip per
+    distinct section)
+    """
+    by_section = defaultdict(list)
+    for uid, part in parts.items():
+        if part:
+            by_section[part['section']].append(uid)
+    bodies = {}
+    for section, uids in by_section.items():
+        fetched = fetch_sections(mail, uids, f'BODY.PEEK[{section}]<0.{MAX_BODY_BYTES}>')
+        for uid in uids:
+            raw = fetched.get(uid, {}).get(section, b'')
+            bodies[uid] = decode_text_part(raw, parts[uid])
+    return bodies
+
+def _decode_subject(raw):
+    subject, encoding = decode_header(raw or '')[0]
+    if isinstance(subject, bytes):
+        subject = subject.decode(encoding or 'utf-8', errors='replace')
+    return subject
+
+def iter_new_messages(mail, checkpoint):
+    """
+    Yield (records, last_uid, uidvalidity) per batch of new messages
+    
+    Headers and BODYSTRUCTURE are fetched first, then only the text part
+    of each message, capped at MAX_BODY_BYTES (BODY.PEEK: \\Seen is only
+    set by mark_seen() once the run has committed); messages whose
+    Message-ID was already processed are skipped.
+    """
+    uidvalidity = get_uidvalidity(mail)
+    saved_validity, last_uid = checkpoint.get(MAILBOX)
+    if saved_validity != uidvalidity:
+        if saved_validity is not None:
+            print("ℹ️  UIDVALIDITY changed - rescanning recent mail")
+        last_uid = 0
+
+    uids = search_new_uids(mail, last_uid)
+    print(f"📬 Found {len(uids)} new email(s) since UID {last_uid}")
+
+    parser = email.parser.BytesParser()
+    for i in range(0, len(uids), BATCH_SIZE):
+        chunk = uids[i:i + BATCH_SIZE]
+        meta = fetch_sections(mail, chunk, 'BODYSTRUCTURE BODY.PEEK[HEADER]')
+        headers = {
+            uid: parser.parsebytes(sections.get('HEADER', b''), headersonly=True)
+            for uid, sections in meta.items()
+        }
+
+        message_ids = {uid: (h.get('Message-ID') or f"uid:{uidvalidity}:{uid}").strip() for uid, h in headers.items()}
+        seen = checkpoint.processed(message_ids.values())
+        todo = [uid for uid in chunk if uid in headers and message_ids[uid] not in seen]
+
+        # Only the reply text part is downloaded - never attachments
+        parts = {}
+        for uid in todo:
+            structure = parse_bodystructure(meta[uid].get('BODYSTRUCTURE'))
+            parts[uid] = select_text_part(structure) if structure else _header_part(headers[uid])
+        bodies = fetch_text_bodies(mail, parts)
+
+        records = []
+        for uid in todo:
+            header = headers[uid]
+            records.append({
+                'uid': uid,
+                'message_id': message_ids[uid],
+                'subject': _decode_subject(header.get('Subject')),
+                'from': header.get('From'),
+                'headers': header,
+                'body': bodies.get(uid, ''),
+            })
+
+        yield records, chunk[-1], uidvalidity
+
+def is_system_mail(record):
+    """Mail the MoM system sent itself: it carries X-MoM-Task-ID, which replies never copy"""
+    return is_task_mail(record['headers'])
+
+def process_reply(record, ack_queue, batch):
+    """Match one reply to a task, stage its status change and queue the acknowledgement"""
+    subject = record['subject']
+    body = record['body']
+    from_email = record['from']
+    
+    print(f"\n📨 Processing: {subject[:60]}...")
+    
+    # Our own reminders / acks / assignment copies are not replies
+    if is_system_mail(record):
+        print("ℹ️  Skipping mail sent by the MoM system")
+        return False
+    
+    # Route on the task headers, then the subject token, then the title
+    task = None
+    task_id = task_id_from_headers(record['headers']) or extract_task_id(subject)
+    if task_id:
+        task = batch.get(task_id)
+    if not task:
+        task = batch.match_title(subject)
+        if task:
+            task_id = task['TaskID']
+    
+    if not task:
+        print(f"⚠️  Could not match email to any task")
+        return False
+    
+    # Detect status from body
+    detected_status = detect_status_from_content(body)
+    
+    if not detected_status:
+        print(f"⚠️  No status keyword detected in email body")
+        return False
+    
+    print(f"✅ Detected status: {detected_status}")
+    
+    # Stage the status change (written once, at the end of the run)
+    update_notes = f"Email reply: {body[:100]}..."
+    if batch.set_status(task_id, detected_status, update_notes, actor=from_email):
+        # Send acknowledgement
+        send_acknowledgement_email(from_email, task, detected_status, body[:200], queue=ack_queue)
+        return True
+    return False
+
 def process_email_replies():
-    """Main function to process email replies"""
+    """Main function to process email replies (new mail since the last checkpoint)"""
     print("=" * 70)
     print("📧 EMAIL REPLY PROCESSOR - STARTED")
     print("=" * 70)
@@ -296,79 +542,36 @@ def process_email_replies():
     if not mail:
         return
     
+    checkpoint = ImapCheckpoint()
+    processed_count = 0
+    ack_queue = MailQueue()
+    
     try:
-        # Search for unread emails
-        status, messages = mail.search(None, 'UNSEEN')
-        email_ids = messages[0].split()
-        
-        if not email_ids:
-            print("✅ No unread emails to process")
-            return
-        
-        print(f"📬 Found {len(email_ids)} unread email(s)")
+        batch = TaskUpdateBatch()
+        message_ids = []
+        seen_uids = []
+        position = None
+        for records, last_uid, uidvalidity in iter_new_messages(mail, checkpoint):
+            for record in records:
+                try:
+                    if process_reply(record, ack_queue, batch):
+                        processed_count += 1
+                except Exception as e:
+                    print(f"❌ Error processing email: {e}")
+            message_ids.extend(r['message_id'] for r in records)
+            seen_uids.extend(r['uid'] for r in records)
+            position = (uidvalidity, last_uid)
         
-        processed_count = 0
+        # ✅ One write for every status change of this run
+        updated = batch.commit()
+        print(f"💾 Committed {updated} task update(s)")
         
-        for email_id in email_ids:
-            try:
-                # Fetch email
-                status, msg_data = mail.fetch(email_id, '(RFC822)')
-                msg = email.message_from_bytes(msg_data[0][1])
-                
-                # Decode subject
-                subject = decode_header(msg['Subject'])[0][0]
-                if isinstance(subject, bytes):
-                    subject = subject.decode()
-                
-                from_email = msg.get('From')
-                
-                print(f"\n📨 Processing: {subject[:60]}...")
-                
-                # Extract email body
-                body = ""
-                if msg.is_multipart():
-                    for part in msg.walk():
-                        if part.get_content_type() == "text/plain":
-                            body = part.get_payload(decode=True).decode()
-                            break
-                else:
-                    body = msg.get_payload(decode=True).decode()
-                
-                # Extract TaskID
-                task_id = extract_task_id(subject)
-                
-                # If no TaskID in subject, try matching by title
-                task = None
-                if task_id:
-                    task = get_task_by_id(task_id)
-                else:
-                    task = get_task_by_title_match(subject)
-                    if task:
-                        task_id = task['TaskID']
-                
-                if not task:
-                    print(f"⚠️  Could not match email to any task")
-                    continue
-                
-                # Detect status from body
-                detected_status = detect_status_from_content(body)
-                
-                if not detected_status:
-                    print(f"⚠️  No status keyword detected in email body")
-                    continue
-                
-                print(f"✅ Detected status: {detected_status}")
-                
-                # Update task status
-                update_notes = f"Email reply: {body[:100]}..."
-                if update_task_status(task_id, detected_status, update_notes):
-                    # Send acknowledgement
-                    send_acknowledgement_email(from_email, task, detected_status, body[:200])
-                    processed_count += 1
-                
-            except Exception as e:
-                print(f"❌ Error processing email: {e}")
-                continue
+        # Only advance the checkpoint / acknowledge once the write succeeded
+        checkpoint.mark_processed(message_ids)
+        if position:
+            checkpoint.set(MAILBOX, *position)
+        mark_seen(mail, seen_uids)
+        ack_queue.flush()
         
         print(f"\n✅ Processed {processed_count} email(s) successfully")
         
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+ESCALATION ENGINE
+- Computes the escalation level of every open task in one vectorized pass
+  Level 1: Executive → Manager      (escalation.level1_after_days overdue)
+  Level 2: Manager → EA Office      (escalation.level2_after_days overdue)
+  Level 3: Boss-MoM → Boss          (escalation.boss_mom_after_days overdue)
+- Mails only new (TaskID, Level) escalations, so the three daily runs are
+  idempotent; "new" is decided by the escalation ledger
+  (storage.state_db_file) alone, so runs on a fresh checkout of the
+  workbook don't re-send either
+- Only escalations whose mail went out are recorded (ledger + Escalations
+  sheet); a failed send is retried by the next run
+"""
+
+import os
+import uuid
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import yaml
+from openpyxl import load_workbook
+
+from escalation_ledger import EscalationLedger
+from mail_queue import MailQueue
+from mom_data import load_sheets
+from workbook_cache import parse_dates
+from workbook_io import atomic_save_workbook, retry_on_conflict, workbook_revision
+
+# ---------------------------------------------------------
+# Load config
+# ---------------------------------------------------------
+with open("config.yaml", "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+
+MOM_FILE = config["paths"]["mom_file"]
+ESCALATION = config["escalation"]
+BOSS_MEETING_ID = config.get("meetings", {}).get("boss_meeting_id")
+EMAIL_CONFIG = config.get("email", {})
+
+OWNER_EMAIL = os.getenv("OWNER_EMAIL") or os.getenv("TEST_EMAIL") or EMAIL_CONFIG.get("sender")
+
+ESCALATION_COLUMNS = ["EscalationID", "TaskID", "Level", "Date", "EscalatedTo"]
+
+CLOSED_STATUSES = ["completed", "testing"]
+
+LEVEL_LABELS = {
+    1: "Level 1 – Manager",
+    2: "Level 2 – EA Office",
+    3: "Level 3 – Boss",
+}
+
+
+# ---------------------------------------------------------
+# Recipients
+# ---------------------------------------------------------
+def build_manager_directory(users):
+    """Department → manager email (exact 'Manager' role preferred)"""
+    if users is None or users.empty or "Role" not in users.columns:
+        return {}
+    role = users["Role"].astype("string").str.strip().str.lower()
+    managers = users[role.str.contains("manager", na=False)].copy()
+    managers["_rank"] = np.where(role[managers.index] == "manager", 0, 1)
+    managers = managers.sort_values("_rank").drop_duplicates("Department")
+    return dict(zip(managers["Department"], managers["Email"]))
+
+
+def ea_office_email(users):
+    """First user of the configured EA department, else the owner"""
+    if users is not None and not users.empty and "Department" in users.columns:
+        ea = users[users["Department"] == ESCALATION.get("ea_department")]
+        if not ea.empty:
+            return ea.iloc[0]["Email"]
+    return OWNER_EMAIL
+
+
+# ---------------------------------------------------------
+# Level computation
+# ---------------------------------------------------------
+def compute_escalations(tasks, users, today=None):
+    """
+    Escalation level of every open, overdue task (vectorized)
+
+    Returns:
+        DataFrame: TaskID, Title, Department, AssignedTo, Deadline,
+                   DaysOverdue, Level (1-3), EscalatedTo
+    """
+    today = pd.Timestamp(today or datetime.today()).normalize()
+
+    status = tasks["Status"].astype("string").str.strip().str.lower()
+    deadline = parse_dates(tasks["Deadline"]).dt.normalize()
+    days_overdue = (today - deadline).dt.days
+
+    is_boss = tasks.get("Category", pd.Series(index=tasks.index, dtype=object)).eq("Boss-MoM")
+    if BOSS_MEETING_ID is not None:
+        is_boss |= tasks["MeetingID"].astype("string").eq(str(BOSS_MEETING_ID)).fillna(False)
+
+    level = np.select(
+        [
+            is_boss & (days_overdue >= ESCALATION["boss_mom_after_days"]),
+            days_overdue >= ESCALATION["level2_after_days"],
+            days_overdue >= ESCALATION["level1_after_days"],
+        ],
+        [3, 2, 1],
+        default=0
+    )
+
+    open_tasks = ~status.isin(CLOSED_STATUSES).fillna(False) & deadline.notna()
+    mask = open_tasks & (level > 0)
+
+    result = tasks.loc[mask, ["TaskID", "Title", "Department", "AssignedTo"]].copy()
+    result["Deadline"] = deadline[mask]
+    result["DaysOverdue"] = days_overdue[mask].astype(int)
+    result["Level"] = level[mask.to_numpy()]
+
+    managers = build_manager_directory(users)
+    recipients = pd.Series(OWNER_EMAIL, index=result.index, dtype=object)
+    recipients[result["Level"] == 1] = result["Department"].map(managers).fillna(OWNER_EMAIL)
+    recipients[result["Level"] == 2] = ea_office_email(users)
+    recipients[result["Level"] == 3] = ESCALATION.get("boss_email") or OWNER_EMAIL
+    result["EscalatedTo"] = recipients
+
+    return result.reset_index(drop=True)
+
+
+# ---------------------------------------------------------
+# Escalations sheet (incremental)
+# ---------------------------------------------------------
+def append_escalations(rows, excel_path=MOM_FILE):
+    """
+    Append escalation rows to the sheet without rewriting existing ones
+    (reloaded and re-appended if another process commits the workbook first)
+    """
+    if not rows:
+        return 0
+
+    def attempt():
+        revision = workbook_revision(excel_path)
+        wb = load_workbook(excel_path)
+        if "Escalations" in wb.sheetnames:
+            ws = wb["Escalations"]
+        else:
+            ws = wb.create_sheet("Escalations")
+            ws.append(ESCALATION_COLUMNS)
+
+        header = [cell.value for cell in ws[1]]
+
+        # ws.append() would go after trailing blank-but-formatted rows
+        next_row = ws.max_row + 1
+        while next_row > 2 and all(cell.value is None for cell in ws[next_row - 1]):
+            next_row -= 1
+
+        for offset, row in enumerate(rows):
+            for col_idx, col in enumerate(header, start=1):
+                ws.cell(row=next_row + offset, column=col_idx, value=row.get(col))
+
+        atomic_save_workbook(wb, excel_path, expected_revision=revision)
+
+    retry_on_conflict(attempt, excel_path)
+    return len(rows)
+
+
+def _test_mode_recipient(recipient):
+    if EMAIL_CONFIG.get("test_mode") and EMAIL_CONFIG.get("test_email"):
+        return EMAIL_CONFIG["test_email"]
+    return recipient
+
+
+# ---------------------------------------------------------
+# MAIN
+# ---------------------------------------------------------
+def run_escalations(today=None):
+    print("✅ Running MoM Escalation Engine")
+
+    sheets = load_sheets(["Tasks", "Users"])
+    tasks, users = sheets["Tasks"], sheets["Users"]
+
+    escalations = compute_escalations(tasks, users, today)
+    ledger = EscalationLedger()
+    known = ledger.sent_keys()
+
+    keys = list(zip(escalations["TaskID"].astype(str), escalations["Level"].astype(int)))
+    new = escalations[[key not in known for key in keys]]
+
+    if new.empty:
+        print(f"✅ No new escalations ({len(escalations)} already recorded)")
+        return new
+
+    queue = MailQueue()
+    for row in new.itertuples(index=False):
+        subject = f"MoM Escalation ({LEVEL_LABELS[row.Level]}): {row.Title}"
+        body = f"""
+Dear Team,
+
+The following MoM task is {row.DaysOverdue} day(s) overdue and has been escalated to {LEVEL_LABELS[row.Level]}:
+
+Task ID: {row.TaskID}
+Task: {row.Title}
+Department: {row.Department}
+Assigned To: {row.AssignedTo}
+Deadline: {row.Deadline.date()}
+
+Please follow up with the assignee.
+
+Regards,
+Koenig MoM Automation
+"""
+        queue.enqueue(_test_mode_recipient(row.EscalatedTo), subject, body)
+    results = queue.flush()
+
+    sent = [row for row, result in zip(new.itertuples(index=False), results) if result["sent"]]
+    ledger.record((row.TaskID, row.Level, row.EscalatedTo) for row in sent)
+
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    append_escalations([
+        {
+            "EscalationID": f"ESC-{uuid.uuid4().hex[:8].upper()}",
+            "TaskID": row.TaskID,
+            "Level": int(row.Level),
+            "Date": now,
+            "EscalatedTo": row.EscalatedTo,
+        }
+        for row in sent
+    ])
+    print(f"⚠️  Recorded {len(sent)} new escalation(s)")
+    if len(sent) < len(new):
+        print(f"⚠️  {len(new) - len(sent)} escalation mail(s) failed; retried next run")
+    return new
+
+
+if __name__ == "__main__":
+    run_escalations()
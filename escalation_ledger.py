@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+SENT-ESCALATION LEDGER
+- Remembers which escalations were already raised, keyed by
+  (TaskID, Level)
+- Lives in the storage.state_db_file SQLite database (WAL mode) next to
+  the reminder ledger, so it survives fresh checkouts in CI
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+
+import yaml
+
+# ---------------------------------------------------------
+# Load config
+# ---------------------------------------------------------
+with open("config.yaml", "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+
+DB_FILE = config.get("storage", {}).get("state_db_file", "MoM_State.db")
+
+
+class EscalationLedger:
+    """Persistent set of (TaskID, Level) already escalated"""
+
+    def __init__(self, db_file=DB_FILE):
+        self.db_file = db_file
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sent_escalations (
+                    TaskID TEXT NOT NULL,
+                    Level INTEGER NOT NULL,
+                    EscalatedTo TEXT,
+                    SentAt TEXT NOT NULL,
+                    PRIMARY KEY (TaskID, Level)
+                )
+            """)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_file, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def sent_keys(self):
+        """All (TaskID, Level) escalated so far"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT TaskID, Level FROM sent_escalations").fetchall()
+        return {(task_id, int(level)) for task_id, level in rows}
+
+    def record(self, rows):
+        """Mark escalations as sent: (TaskID, Level, EscalatedTo) tuples"""
+        rows = list(rows)
+        if not rows:
+            return 0
+        sent_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO sent_escalations VALUES (?, ?, ?, ?)",
+                [(str(task_id), int(level), recipient, sent_at) for task_id, level, recipient in rows]
+            )
+        return len(rows)
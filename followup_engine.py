@@ -2,7 +2,10 @@ import pandas as pd
 import os
 from datetime import datetime, timedelta
 import yaml
-from email_engine import send_email
+from mail_queue import MailQueue
+from reminder_ledger import ReminderLedger, current_slot
+from task_store import get_task_store
+from workbook_cache import parse_dates
 
 with open("config.yaml", "r") as f:
     config = yaml.safe_load(f)
@@ -10,37 +13,93 @@ with open("config.yaml", "r") as f:
 MOM_FILE = config["paths"]["mom_file"]
 OWNER_EMAIL = os.getenv("TEST_EMAIL")
 
+REMINDER_DAYS_BEFORE = int(config.get("reminders", {}).get("days_before_deadline", 0))
+
+
+def select_reminder_candidates(df, today=None, days_before=REMINDER_DAYS_BEFORE):
+    """
+    Pick pending tasks that need a reminder, in one vectorized pass
+    
+    Args:
+        df: Tasks frame
+        today: date to compare against (default: today)
+        days_before: remind this many days ahead of the deadline
+    
+    Returns:
+        DataFrame: TaskID, Title, Department, AssignedTo, Deadline,
+                   DaysLeft and ReminderType (overdue / due_today / due_soon)
+    """
+    today = pd.Timestamp(today or datetime.today()).normalize()
+
+    status = df["Status"].astype("string").str.strip().str.lower().astype("category")
+    deadline = parse_dates(df["Deadline"]).dt.normalize()
+
+    # ✅ NaN status / NaT deadline simply fail the mask
+    mask = (status == "pending") & (deadline <= today + pd.Timedelta(days=days_before))
+
+    candidates = df.loc[mask, ["TaskID", "Title", "Department", "AssignedTo"]].copy()
+    candidates["Deadline"] = deadline[mask]
+    candidates["DaysLeft"] = (candidates["Deadline"] - today).dt.days
+    candidates["ReminderType"] = pd.Categorical.from_codes(
+        (candidates["DaysLeft"] >= 0).astype(int) + (candidates["DaysLeft"] > 0).astype(int),
+        categories=["overdue", "due_today", "due_soon"]
+    )
+    return candidates.reset_index(drop=True)
+
+
 def process_followups():
     print("✅ Running MoM Followup Engine")
 
-    df = pd.read_excel(MOM_FILE, sheet_name="Tasks")
-    df["Deadline"] = pd.to_datetime(df["Deadline"], errors="coerce")
+    df = get_task_store().load_tasks()
+    candidates = select_reminder_candidates(df)
+    print(f"📋 {len(candidates)} of {len(df)} task(s) need a reminder")
 
-    today = datetime.today().date()
+    # ✅ Skip reminders already sent in this slot (cron runs several times a day)
+    ledger = ReminderLedger()
+    slot = current_slot()
+    recipient = str(OWNER_EMAIL)
+    already_sent = ledger.sent_keys(slot)
 
-    for _, row in df.iterrows():
-        if row["Status"].lower() != "pending":
-            continue
-
-        if pd.isna(row["Deadline"]):
-            continue   # ✅ FIXES NaT ERROR
+    queue = MailQueue()
+    queued_keys = []
 
-        due = row["Deadline"].date()
+    for row in candidates.itertuples(index=False):
+        key = (str(row.TaskID), slot, recipient)
+        if key in already_sent:
+            continue
 
-        if today >= due:
-            subject = f"MoM Follow-Up: {row['Title']}"
-            body = f"""
-Dear {row['AssignedTo']},
+        if row.ReminderType == "due_soon":
+            subject = f"MoM Reminder: {row.Title} (due in {row.DaysLeft} day(s))"
+        else:
+            subject = f"MoM Follow-Up: {row.Title}"
+        body = f"""
+Dear {row.AssignedTo},
 
 This is a reminder for your pending MoM task:
 
-Task: {row['Title']}
-Department: {row['Department']}
-Deadline: {row['Deadline'].date()}
+Task: {row.Title}
+Department: {row.Department}
+Deadline: {row.Deadline.date()}
 
 Please update your status.
 
 Regards,
 Koenig MoM Automation
 """
-            send_email(OWNER_EMAIL, subject, body)
+        queue.enqueue(OWNER_EMAIL, subject, body, task_id=row.TaskID)
+        queued_keys.append(key)
+
+    print(f"ℹ️  Slot {slot}: {len(candidates) - len(queued_keys)} reminder(s) already sent, {len(queued_keys)} new")
+
+    # ✅ Send all reminders concurrently (rate-limited)
+    results = queue.flush()
+    ledger.record(key for key, result in zip(queued_keys, results) if result["sent"])
+    pruned = ledger.prune()
+    if pruned:
+        print(f"🧹 Pruned {pruned} old reminder ledger row(s)")
+    print(f"✅ Follow-ups done: {sum(r['sent'] for r in results)}/{len(results)} reminder(s) sent")
+    return results
+
+
+if __name__ == "__main__":
+    process_followups()
@@ -1,4 +1,8 @@
 from followup_engine import process_followups
+from task_log import TaskLog
+
+# Fold any journaled status changes still pending into the Tasks table
+TaskLog().compact()
 
 print("✅ Running scheduled MoM followups...")
 process_followups()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+IMAP CHECKPOINT
+- Last processed (UIDVALIDITY, UID) per mailbox
+- Message-IDs already processed (so a re-delivered / re-flagged mail
+  is never applied twice)
+- Lives in the storage.state_db_file SQLite database (WAL mode), which CI
+  persists between runs
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+
+import yaml
+
+# ---------------------------------------------------------
+# Load config
+# ---------------------------------------------------------
+with open("config.yaml", "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+
+DB_FILE = config.get("storage", {}).get("state_db_file", "MoM_State.db")
+
+
+class ImapCheckpoint:
+    """Persistent IMAP read position + processed Message-IDs"""
+
+    def __init__(self, db_file=DB_FILE):
+        self.db_file = db_file
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS imap_checkpoint (
+                    Mailbox TEXT PRIMARY KEY,
+                    UidValidity INTEGER NOT NULL,
+                    LastUid INTEGER NOT NULL,
+                    UpdatedAt TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS processed_messages (
+                    MessageID TEXT PRIMARY KEY,
+                    ProcessedAt TEXT NOT NULL
+                )
+            """)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_file, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, mailbox):
+        """(uidvalidity, last_uid) or (None, 0) if never run"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT UidValidity, LastUid FROM imap_checkpoint WHERE Mailbox = ?", (mailbox,)
+            ).fetchone()
+        return (row[0], row[1]) if row else (None, 0)
+
+    def set(self, mailbox, uidvalidity, last_uid):
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO imap_checkpoint VALUES (?, ?, ?, ?)",
+                (mailbox, int(uidvalidity), int(last_uid), now)
+            )
+
+    def processed(self, message_ids):
+        """Subset of `message_ids` already processed"""
+        ids = [m for m in message_ids if m]
+        found = set()
+        with self._connect() as conn:
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = conn.execute(
+                    f"SELECT MessageID FROM processed_messages WHERE MessageID IN ({placeholders})", chunk
+                ).fetchall()
+                found.update(r[0] for r in rows)
+        return found
+
+    def mark_processed(self, message_ids):
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO processed_messages VALUES (?, ?)",
+                [(m, now) for m in message_ids if m]
+            )
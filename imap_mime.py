@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+IMAP MIME HELPERS
+- Parse a FETCH BODYSTRUCTURE response into nested lists
+- Pick the reply text part (text/plain, else text/html) without
+  downloading the message: attachments and forwarded messages are skipped
+- Decode a (possibly truncated) part with its transfer encoding and the
+  declared charset, never raising on bad bytes
+"""
+
+import binascii
+import html
+import quopri
+import re
+
+_TOKEN = re.compile(rb'\(|\)|"(?:[^"\\]|\\.)*"|[^\s()"]+')
+_TAG = re.compile(r'<[^>]+>')
+_BLOCK_END = re.compile(r'<\s*(br|/p|/div|/tr|/li|/h\d)\b[^>]*>', re.IGNORECASE)
+_INVISIBLE = re.compile(r'<(script|style|head)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+
+
+# ---------------------------------------------------------
+# BODYSTRUCTURE
+# ---------------------------------------------------------
+def extract_bodystructure(meta):
+    """Raw "( ... )" that follows BODYSTRUCTURE in a FETCH response, or None"""
+    start = meta.upper().find(b'BODYSTRUCTURE (')
+    if start < 0:
+        return None
+    start = meta.index(b'(', start)
+    depth, in_quote, escaped = 0, False, False
+    for i in range(start, len(meta)):
+        ch = meta[i:i + 1]
+        if in_quote:
+            if escaped:
+                escaped = False
+            elif ch == b'\\':
+                escaped = True
+            elif ch == b'"':
+                in_quote = False
+        elif ch == b'"':
+            in_quote = True
+        elif ch == b'(':
+            depth += 1
+        elif ch == b')':
+            depth -= 1
+            if depth == 0:
+                return meta[start:i + 1]
+    return None
+
+
+def parse_bodystructure(raw):
+    """BODYSTRUCTURE bytes → nested lists of str / None"""
+    stack = [[]]
+    for token in _TOKEN.findall(raw or b''):
+        if token == b'(':
+            stack.append([])
+        elif token == b')':
+            if len(stack) > 1:
+                done = stack.pop()
+                stack[-1].append(done)
+        elif token.startswith(b'"'):
+            stack[-1].append(re.sub(rb'\\(.)', rb'\1', token[1:-1]).decode('utf-8', 'replace'))
+        elif token.upper() == b'NIL':
+            stack[-1].append(None)
+        else:
+            stack[-1].append(token.decode('ascii', 'replace'))
+    return stack[0][0] if stack[0] and isinstance(stack[0][0], list) else None
+
+
+def _params(value):
+    if not isinstance(value, list):
+        return {}
+    return {
+        str(value[i]).lower(): value[i + 1]
+        for i in range(0, len(value) - 1, 2)
+        if value[i] is not None
+    }
+
+
+def _is_attachment(fields, disposition_index):
+    disposition = fields[disposition_index] if len(fields) > disposition_index else None
+    return (
+        isinstance(disposition, list) and disposition
+        and str(disposition[0]).lower() == 'attachment'
+    )
+
+
+def iter_leaf_parts(structure, section=''):
+    """Yield a dict per leaf part: section, type, subtype, charset, encoding, size, attachment"""
+    if not structure:
+        return
+    if isinstance(structure[0], list):
+        # multipart: leading children, then subtype + extension data
+        children = []
+        for item in structure:
+            if not isinstance(item, list):
+                break
+            children.append(item)
+        for i, child in enumerate(children, 1):
+            yield from iter_leaf_parts(child, f"{section}.{i}" if section else str(i))
+        return
+
+    main_type = str(structure[0] or '').lower()
+    sub_type = str(structure[1] or '').lower() if len(structure) > 1 else ''
+    size = structure[6] if len(structure) > 6 else None
+    # text/* has an extra "lines" field before the extension data
+    disposition_index = 9 if main_type == 'text' else 8
+    yield {
+        'section': section or '1',
+        'type': main_type,
+        'subtype': sub_type,
+        'charset': _params(structure[2] if len(structure) > 2 else None).get('charset'),
+        'encoding': str(structure[5] or '7bit').lower() if len(structure) > 5 else '7bit',
+        'size': int(size) if str(size or '').isdigit() else None,
+        'attachment': main_type == 'message' or bool(_is_attachment(structure, disposition_index)),
+    }
+
+
+def select_text_part(structure):
+    """The inline text/plain part, else the inline text/html part, else None"""
+    candidates = [
+        part for part in iter_leaf_parts(structure)
+        if part['type'] == 'text' and not part['attachment']
+    ]
+    for subtype in ('plain', 'html'):
+        for part in candidates:
+            if part['subtype'] == subtype:
+                return part
+    return None
+
+
+# ---------------------------------------------------------
+# Decoding
+# ---------------------------------------------------------
+def _transfer_decode(data, encoding):
+    if encoding == 'base64':
+        data = re.sub(rb'[^A-Za-z0-9+/=]', b'', data)
+        data = data[:len(data) - len(data) % 4]
+        try:
+            return binascii.a2b_base64(data)
+        except binascii.Error:
+            return b''
+    if encoding == 'quoted-printable':
+        return quopri.decodestring(data)
+    return data
+
+
+def html_to_text(markup):
+    """Rough text rendering of an HTML body (enough for keyword detection)"""
+    markup = _INVISIBLE.sub(' ', markup)
+    markup = re.sub(r'<[^>]*$', '', markup)  # tag cut off by the byte cap
+    markup = _BLOCK_END.sub('\n', markup)
+    text = html.unescape(_TAG.sub(' ', markup))
+    lines = (' '.join(line.split()) for line in text.splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+def decode_text_part(data, part):
+    """Bytes of a part (possibly cut at the byte cap) → str"""
+    payload = _transfer_decode(data or b'', (part or {}).get('encoding') or '7bit')
+    charset = (part or {}).get('charset') or 'utf-8'
+    try:
+        text = payload.decode(charset, errors='replace')
+    except LookupError:
+        text = payload.decode('utf-8', errors='replace')
+    if (part or {}).get('subtype') == 'html':
+        text = html_to_text(text)
+    return text
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+OUTBOUND MAIL QUEUE
+- Collects messages from follow-ups, daily summary and acknowledgements
+- Sends them with N concurrent SMTP sessions (asyncio workers)
+- Token-bucket rate limit matching the provider's per-minute cap
+- Retries failed messages with exponential backoff
+
+Usage:
+    queue = MailQueue()
+    queue.enqueue("Sunil", "Subject", "Body")
+    results = queue.flush()
+"""
+
+import asyncio
+import os
+import time
+
+import yaml
+
+from email_engine import build_message, create_session, get_email_address, _smtp_settings
+
+# ---------------------------------------------------------
+# Load config
+# ---------------------------------------------------------
+with open("config.yaml", "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+
+QUEUE_SETTINGS = config.get("email", {}).get("queue", {}) or {}
+
+
+# ---------------------------------------------------------
+# Rate limiter
+# ---------------------------------------------------------
+class TokenBucket:
+    """Allows `rate_per_minute` sends per minute, bursting up to `capacity`"""
+
+    def __init__(self, rate_per_minute, capacity=None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or max(1, min(rate_per_minute, 10))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+
+# ---------------------------------------------------------
+# Queue
+# ---------------------------------------------------------
+class MailQueue:
+    """Buffer outbound mail, then send it concurrently with flush()"""
+
+    def __init__(self, concurrency=None, rate_per_minute=None, max_retries=None,
+                 backoff_seconds=None, session_factory=create_session):
+        self.concurrency = int(concurrency or QUEUE_SETTINGS.get("concurrency", 3))
+        self.rate_per_minute = int(rate_per_minute or QUEUE_SETTINGS.get("rate_limit_per_minute", 30))
+        self.max_retries = int(max_retries if max_retries is not None else QUEUE_SETTINGS.get("max_retries", 3))
+        self.backoff_seconds = float(backoff_seconds or QUEUE_SETTINGS.get("backoff_seconds", 2))
+        self.session_factory = session_factory
+        self.jobs = []
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def enqueue(self, to_recipient, subject, body, task_id=None):
+        """Queue a plain-text email (name or address), optionally tagged with a TaskID"""
+        to_email = get_email_address(to_recipient)
+        sender = os.getenv("SMTP_USER")
+        self.enqueue_message(build_message(sender, to_email, subject, body, task_id=task_id), label=to_recipient)
+
+    def enqueue_message(self, msg, label=None):
+        """Queue a ready-built MIME message"""
+        self.jobs.append({
+            "msg": msg,
+            "to": msg["To"],
+            "label": label or msg["To"],
+            "subject": msg["Subject"],
+            "attempts": 0,
+            "sent": False,
+            "error": None
+        })
+
+    def flush(self):
+        """Send everything queued; returns one result dict per message"""
+        jobs, self.jobs = self.jobs, []
+        if not jobs:
+            return []
+
+        try:
+            _smtp_settings()
+        except ValueError as e:
+            # Nothing can be sent; don't burn retries on it
+            print(f"❌ Mail queue: {len(jobs)} message(s) not sent: {e}")
+            for job in jobs:
+                job["error"] = str(e)
+        else:
+            started = time.monotonic()
+            asyncio.run(self._dispatch(jobs))
+            print(f"📤 Mail queue: {sum(1 for job in jobs if job['sent'])}/{len(jobs)} sent "
+                  f"in {time.monotonic() - started:.1f}s")
+
+        return [{k: job[k] for k in ("to", "subject", "sent", "attempts", "error")} for job in jobs]
+
+    async def _dispatch(self, jobs):
+        queue = asyncio.Queue()
+        for job in jobs:
+            queue.put_nowait(job)
+
+        bucket = TokenBucket(self.rate_per_minute)
+        workers = [
+            asyncio.create_task(self._worker(queue, bucket))
+            for _ in range(min(self.concurrency, len(jobs)))
+        ]
+        await queue.join()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _retry_later(self, queue, job, delay):
+        # Re-queue before marking the failed attempt done so join() keeps waiting
+        await asyncio.sleep(delay)
+        queue.put_nowait(job)
+        queue.task_done()
+
+    async def _worker(self, queue, bucket):
+        session = None
+        retries = set()
+        try:
+            while True:
+                job = await queue.get()
+                retrying = False
+                try:
+                    await bucket.acquire()
+                    job["attempts"] += 1
+                    if session is None:
+                        session = await asyncio.to_thread(self.session_factory)
+                    await asyncio.to_thread(session.send, job["msg"])
+                    job["sent"] = True
+                    job["error"] = None
+                    print(f"✅ Email sent to {job['to']} ({job['label']})")
+                except Exception as e:
+                    job["error"] = str(e)
+                    if session is not None:
+                        await asyncio.to_thread(session.close)
+                        session = None
+                    if job["attempts"] <= self.max_retries:
+                        delay = self.backoff_seconds * (2 ** (job["attempts"] - 1))
+                        print(f"⚠️  Email to {job['to']} failed ({e}), retrying in {delay:.0f}s")
+                        task = asyncio.create_task(self._retry_later(queue, job, delay))
+                        retries.add(task)
+                        task.add_done_callback(retries.discard)
+                        retrying = True
+                    else:
+                        print(f"❌ Email failed to {job['to']} after {job['attempts']} attempt(s): {e}")
+                finally:
+                    if not retrying:
+                        queue.task_done()
+        finally:
+            if session is not None:
+                await asyncio.to_thread(session.close)
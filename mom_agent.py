@@ -1,10 +1,13 @@
-import pandas as pd
 import os
 import yaml
 import uuid
 from datetime import datetime
 from dotenv import load_dotenv
-from email_engine import send_email
+from email_engine import send_email, send_emails
+from task_store import get_task_store
+from task_log import TaskLog
+from task_cube import apply_changes
+from mom_data import dataset_version
 
 # ✅ Load ENV safely
 load_dotenv(dotenv_path=".env")
@@ -17,7 +20,8 @@ MOM_FILE = config["paths"]["mom_file"]
 OWNER_EMAIL = os.getenv("TEST_EMAIL") or os.getenv("SMTP_USER")
 
 
-def add_task(meeting_id, title, details, department, assigned_to, created_by, deadline, category):
+def _build_task(meeting_id, title, details, department, assigned_to, created_by, deadline, category):
+    """Build a Tasks row with a fresh TaskID"""
 
     # ✅ Generate unique Task ID
     task_id = f"TASK-{uuid.uuid4().hex[:8].upper()}"
@@ -26,11 +30,7 @@ def add_task(meeting_id, title, details, department, assigned_to, created_by, de
     if not meeting_id or meeting_id == "AI-Extract":
         meeting_id = f"AI-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
 
-    # ✅ Load file
-    df = pd.read_excel(MOM_FILE, sheet_name="Tasks")
-
-    # ✅ Create new row
-    new_task = {
+    return {
         "TaskID": task_id,
         "MeetingID": meeting_id,
         "Title": title,
@@ -44,38 +44,141 @@ def add_task(meeting_id, title, details, department, assigned_to, created_by, de
         "Category": category
     }
 
-    df = pd.concat([df, pd.DataFrame([new_task])], ignore_index=True)
-
-    # ✅ Save back
-    df.to_excel(MOM_FILE, sheet_name="Tasks", index=False)
 
-    # ✅ Email (Crash-proof)
-    subject = f"New MoM Task Assigned: {title}"
+def _assignment_email(task):
+    """Subject and body of the new-task notification"""
+    subject = f"New MoM Task Assigned: {task['Title']}"
     body = f"""
-Dear {assigned_to},
+Dear {task['AssignedTo']},
 
 You have been assigned a new MoM task.
 
-Task: {title}
-Department: {department}
-Deadline: {deadline}
+Task: {task['Title']}
+Department: {task['Department']}
+Deadline: {task['Deadline']}
 
 Regards,
 Praveen Chaudhary
 """
+    return subject, body
+
+
+def _log_created(tasks):
+    """Journal task creation (the row itself is already in the store)"""
+    try:
+        TaskLog().append([
+            {"TaskID": t["TaskID"], "Action": "created", "Actor": t.get("CreatedBy")}
+            for t in tasks
+        ])
+    except Exception as e:
+        print("⚠️ Task log write failed:", e)
+
+
+def add_task(meeting_id, title, details, department, assigned_to, created_by, deadline, category):
+
+    new_task = _build_task(meeting_id, title, details, department, assigned_to, created_by, deadline, category)
+    task_id = new_task["TaskID"]
+
+    # ✅ Single-row insert (no workbook rewrite)
+    before = dataset_version("Tasks")
+    get_task_store().add_task(new_task)
+    apply_changes(before, added=[new_task])
+    _log_created([new_task])
+
+    # ✅ Email (Crash-proof)
+    subject, body = _assignment_email(new_task)
 
     try:
-        send_email(assigned_to, subject, body)
+        send_email(assigned_to, subject, body, task_id=task_id)
     except Exception as e:
-        st.warning("⚠️ User email could not be sent.")
         print("⚠️ User email failed:", e)
 
     try:
         if OWNER_EMAIL:
-            send_email(OWNER_EMAIL, subject, body)
+            send_email(OWNER_EMAIL, subject, body, task_id=task_id)
     except Exception as e:
-        st.warning("⚠️ Admin email could not be sent.")
         print("⚠️ Admin email failed:", e)
 
-    st.success(f"✅ Task saved successfully: {task_id}")
+    print(f"✅ Task saved successfully: {task_id}")
+    return task_id
+
+
+def add_tasks(items):
+    """
+    Save many tasks in one write and notify over one mail session
+    
+    Args:
+        items: list of dicts with the add_task keyword arguments
+               (meeting_id, title, details, department, assigned_to,
+               created_by, deadline, category)
+    
+    Returns:
+        list[dict]: one {"index", "title", "task_id", "error"} per item, in order
+    """
+    results = []
+    new_tasks = []
+
+    for i, item in enumerate(items):
+        title = str(item.get("title") or "").strip()
+        result = {"index": i, "title": title, "task_id": None, "error": None}
+        results.append(result)
+
+        if not title:
+            result["error"] = "Missing title"
+            continue
+
+        try:
+            task = _build_task(
+                meeting_id=item.get("meeting_id"),
+                title=title,
+                details=item.get("details", ""),
+                department=item.get("department", "General"),
+                assigned_to=item.get("assigned_to", "Unassigned"),
+                created_by=item.get("created_by", "System"),
+                deadline=item.get("deadline"),
+                category=item.get("category", "Regular")
+            )
+        except Exception as e:
+            result["error"] = str(e)
+            continue
+
+        result["task_id"] = task["TaskID"]
+        new_tasks.append(task)
+
+    # ✅ One write transaction for the whole batch
+    try:
+        before = dataset_version("Tasks")
+        get_task_store().add_tasks(new_tasks)
+        apply_changes(before, added=new_tasks)
+        _log_created(new_tasks)
+    except Exception as e:
+        print(f"❌ Batch save failed: {e}")
+        for result in results:
+            if result["task_id"]:
+                result["task_id"] = None
+                result["error"] = f"Save failed: {e}"
+        return results
+
+    if not new_tasks:
+        return results
+
+    # ✅ One batched mail send: each assignee + a single digest for the owner
+    messages = [(task["AssignedTo"], *_assignment_email(task), task["TaskID"]) for task in new_tasks]
+    if OWNER_EMAIL:
+        lines = "\n".join(
+            f"- {t['TaskID']}: {t['Title']} → {t['AssignedTo']} (Deadline: {t['Deadline']})"
+            for t in new_tasks
+        )
+        messages.append((
+            OWNER_EMAIL,
+            f"New MoM Tasks Assigned: {len(new_tasks)} task(s)",
+            f"\nThe following MoM tasks were created:\n\n{lines}\n\nRegards,\nKoenig MoM Automation\n"
+        ))
+
+    try:
+        send_emails(messages)
+    except Exception as e:
+        print("⚠️ Batch email failed:", e)
 
+    print(f"✅ Saved {len(new_tasks)}/{len(results)} task(s)")
+    return results
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+SHARED MoM DATA LOADER
+- One entry point for every report / dashboard read
+- Tasks come from the task store, every other sheet from one pass over
+  the workbook snapshot (workbook_cache)
+- Column names stripped, dates datetime64, Status/Department categorical
+- Each sheet is memoized per process under its own dataset_version(),
+  so a write only invalidates the sheet it changed
+"""
+
+import os
+
+import pandas as pd
+import yaml
+
+from task_store import SQLiteTaskStore, get_task_store
+from workbook_cache import read_sheets, sheet_versions, type_columns
+
+# ---------------------------------------------------------
+# Load config
+# ---------------------------------------------------------
+with open("config.yaml", "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+
+MOM_FILE = config["paths"]["mom_file"]
+
+_memo = {}
+
+
+def dataset_version(name):
+    """
+    Changes only when dataset `name` changes: Tasks follows the task
+    store's revision counter (writes to other tables in the same database
+    leave it alone), every other sheet its content fingerprint in the
+    workbook
+    """
+    store = get_task_store()
+    if name == "Tasks" and isinstance(store, SQLiteTaskStore):
+        return store.revision()
+    if not os.path.exists(MOM_FILE):
+        return None
+    return sheet_versions(MOM_FILE).get(name)
+
+
+def load_sheets(sheet_names):
+    """
+    Load several sheets at once (workbook parsed at most once per version)
+
+    Args:
+        sheet_names: e.g. ["Tasks", "Users"]
+
+    Returns:
+        dict: sheet name → DataFrame (empty DataFrame for missing sheets)
+    """
+    versions = {name: dataset_version(name) for name in sheet_names}
+    missing = [name for name in sheet_names if name not in _memo or _memo[name][0] != versions[name]]
+
+    workbook_sheets = [name for name in missing if name != "Tasks"]
+    if workbook_sheets and os.path.exists(MOM_FILE):
+        loaded = read_sheets(workbook_sheets, MOM_FILE)
+    else:
+        loaded = {}
+    for name in workbook_sheets:
+        _memo[name] = (versions[name], loaded.get(name, pd.DataFrame()))
+
+    if "Tasks" in missing:
+        _memo["Tasks"] = (versions["Tasks"], type_columns(get_task_store().load_tasks()))
+
+    # Copies, so callers can't modify the memoized frames
+    return {name: _memo[name][1].copy() for name in sheet_names}
+
+
+def load_tasks():
+    return load_sheets(["Tasks"])["Tasks"]
+
+
+def load_users():
+    return load_sheets(["Users"])["Users"]
@@ -2,10 +2,14 @@ import pandas as pd
 from datetime import date, datetime
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
 from reportlab.lib import colors
-import matplotlib.pyplot as plt
 import yaml
+from functools import lru_cache
+from io import BytesIO
+from reportlab.lib.utils import ImageReader
+from mom_data import load_sheets
+from branding import draw_logo
+from task_cube import get_cube
 import os
 
 # ---------------------------------------------------------
@@ -17,21 +21,15 @@ config_path = os.path.join(base_dir, "config.yaml")
 with open(config_path, "r") as f:
     config = yaml.safe_load(f)
 
-logo_url = config["branding"]["logo_url"]
 MOM_FILE = config["paths"]["mom_file"]
 
 # ---------------------------------------------------------
 # Load Excel data
 # ---------------------------------------------------------
 def load_data():
-    tasks = pd.read_excel(MOM_FILE, sheet_name="Tasks")
-    users = pd.read_excel(MOM_FILE, sheet_name="Users")
-
-    # Strip column names
-    tasks.columns = tasks.columns.str.strip()
-    users.columns = users.columns.str.strip()
-
-    return tasks, users
+    # Column names already stripped by the shared loader
+    sheets = load_sheets(["Tasks", "Users"])
+    return sheets["Tasks"], sheets["Users"]
 
 # ---------------------------------------------------------
 # Get month start → today date range
@@ -50,11 +48,33 @@ def section_title(c, text, y):
     c.drawString(40, y, text)
     return y - 25
 
+# ---------------------------------------------------------
+# Render chart in memory (cached on the plotted numbers)
+# ---------------------------------------------------------
+@lru_cache(maxsize=32)
+def render_bar_chart(labels, values, title, tight=True):
+    """PNG bytes of a bar chart; labels / values must be tuples"""
+    # Imported lazily: Agg canvas, no pyplot / GUI backend state
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(5, 3))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.bar([str(label) for label in labels], values)
+    ax.set_title(title)
+    if tight:
+        fig.tight_layout()
+
+    buf = BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight")
+    return buf.getvalue()
+
 # ---------------------------------------------------------
 # Draw chart and insert into PDF
 # ---------------------------------------------------------
-def add_chart_to_pdf(c, chart_path, y):
-    c.drawImage(chart_path, 50, y - 180, width=500, height=180)
+def add_chart_to_pdf(c, png, y):
+    c.drawImage(ImageReader(BytesIO(png)), 50, y - 180, width=500, height=180)
     return y - 200
 
 # ---------------------------------------------------------
@@ -62,17 +82,12 @@ def add_chart_to_pdf(c, chart_path, y):
 # ---------------------------------------------------------
 def generate_monthly_pdf(output="Monthly_MoM_Summary.pdf"):
 
-    tasks, users = load_data()
     start, today = get_month_range()
 
-    # Filter tasks for this month
-    monthly = tasks[(tasks["CreatedDate"] >= pd.to_datetime(start)) &
-                    (tasks["CreatedDate"] <= pd.to_datetime(today))]
-
-    completed = monthly[monthly["Status"] == "completed"]
-    pending = monthly[monthly["Status"] == "pending"]
-    overdue = monthly[(monthly["Status"] == "pending") &
-                      (monthly["Deadline"] < pd.to_datetime(today))]
+    # Counts for tasks created this month, from the aggregate cube
+    cube = get_cube(today)
+    month = f"{start:%Y-%m}"
+    monthly = cube.summary(Month=month)
 
     # -----------------------------------------------------
     # Create PDF
@@ -82,11 +97,7 @@ def generate_monthly_pdf(output="Monthly_MoM_Summary.pdf"):
     y = height - 50
 
     # Logo
-    try:
-        logo = ImageReader(logo_url)
-        c.drawImage(logo, 240, y - 60, width=120)
-    except:
-        pass
+    draw_logo(c, 240, y - 60, width=120)
 
     y -= 120
 
@@ -106,38 +117,37 @@ def generate_monthly_pdf(output="Monthly_MoM_Summary.pdf"):
 
     c.setFont("Helvetica", 12)
     c.setFillColor(colors.black)
-    c.drawString(50, y, f"Total tasks created this month: {len(monthly)}")
+    c.drawString(50, y, f"Total tasks created this month: {monthly['total']}")
     y -= 20
-    c.drawString(50, y, f"Completed: {len(completed)}")
+    c.drawString(50, y, f"Completed: {monthly['completed']}")
     y -= 20
-    c.drawString(50, y, f"Pending: {len(pending)}")
+    c.drawString(50, y, f"Pending: {monthly['pending']}")
     y -= 20
-    c.drawString(50, y, f"Overdue: {len(overdue)}")
+    c.drawString(50, y, f"Overdue: {monthly['overdue']}")
     y -= 40
 
     # -----------------------------------------------------
     # CHART 1 — Completed vs Pending vs Overdue
     # -----------------------------------------------------
-    chart1 = "chart_status.png"
-    plt.figure(figsize=(5, 3))
-    plt.bar(["Completed", "Pending", "Overdue"], [len(completed), len(pending), len(overdue)])
-    plt.title("Task Status Breakdown")
-    plt.savefig(chart1, bbox_inches="tight")
-    plt.close()
+    chart1 = render_bar_chart(
+        ("Completed", "Pending", "Overdue"),
+        (monthly["completed"], monthly["pending"], monthly["overdue"]),
+        "Task Status Breakdown",
+        tight=False
+    )
 
     y = add_chart_to_pdf(c, chart1, y)
 
     # -----------------------------------------------------
     # CHART 2 — Department Summary
     # -----------------------------------------------------
-    dept_summary = monthly.groupby("Department").size()
-    chart2 = "chart_dept.png"
-    plt.figure(figsize=(5, 3))
-    dept_summary.plot(kind='bar')
-    plt.title("Tasks by Department")
-    plt.tight_layout()
-    plt.savefig(chart2)
-    plt.close()
+    dept_summary = cube.counts_by("Department", Month=month)
+    dept_summary = dept_summary[dept_summary.index != ""]
+    chart2 = render_bar_chart(
+        tuple(dept_summary.index),
+        tuple(int(v) for v in dept_summary.values),
+        "Tasks by Department"
+    )
 
     y = add_chart_to_pdf(c, chart2, y)
 
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+RENDER ALL PDF REPORTS
+- Loads Users + Tasks once
+- Partitions tasks per user (one groupby on AssignedTo) and per
+  department (one groupby on the assignee's department)
+- Renders every User Score / Department Summary PDF in a process pool
+  into paths.export_folder
+
+Usage: python pdf_bulk.py [workers]
+"""
+
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+import yaml
+
+from mom_data import load_sheets
+from pdf_department_summary import render_department_summary
+from pdf_user_score import render_user_score_pdf
+
+# ---------------------------------------------------------
+# Load config
+# ---------------------------------------------------------
+with open("config.yaml", "r") as f:
+    config = yaml.safe_load(f)
+
+EXPORT_FOLDER = config["paths"].get("export_folder", "Exports")
+
+
+def _slug(name):
+    return re.sub(r"[^A-Za-z0-9]+", "_", str(name)).strip("_") or "unnamed"
+
+
+def _render(job):
+    """Worker: render one PDF, returns the job dict with path / error filled in"""
+    kind, name, args, output = job["kind"], job["name"], job["args"], job["output"]
+    try:
+        if kind == "user":
+            render_user_score_pdf(name, *args, output=output)
+        else:
+            render_department_summary(name, *args, output=output)
+        return {"kind": kind, "name": name, "path": output, "error": None}
+    except Exception as e:
+        return {"kind": kind, "name": name, "path": None, "error": str(e)}
+
+
+def build_jobs(users, tasks, output_dir=EXPORT_FOLDER):
+    """One render job per user and per department, with its task partition"""
+    empty = tasks.iloc[0:0]
+    by_user = dict(tuple(tasks.groupby("AssignedTo", sort=False, observed=True)))
+
+    user_dept = users.drop_duplicates("UserID").set_index("UserID")["Department"]
+    dept_of_task = tasks["AssignedTo"].map(user_dept)
+    by_dept = dict(tuple(tasks.groupby(dept_of_task, sort=False, observed=True)))
+
+    jobs = []
+    for user in users.itertuples(index=False):
+        try:
+            user_id = int(user.UserID)
+        except (TypeError, ValueError):
+            continue
+        jobs.append({
+            "kind": "user",
+            "name": user.Name,
+            "args": (user.Department, by_user.get(user_id, empty)),
+            "output": os.path.join(output_dir, f"UserScore_{_slug(user.Name)}_{user_id}.pdf"),
+        })
+
+    for dept in users["Department"].dropna().unique():
+        jobs.append({
+            "kind": "department",
+            "name": dept,
+            "args": (by_dept.get(dept, empty),),
+            "output": os.path.join(output_dir, f"DepartmentSummary_{_slug(dept)}.pdf"),
+        })
+    return jobs
+
+
+def render_all_reports(output_dir=EXPORT_FOLDER, max_workers=None):
+    """
+    Render every User Score and Department Summary PDF
+
+    Args:
+        output_dir: target folder (created if missing)
+        max_workers: process pool size (None = CPU count, 1 = no pool)
+
+    Returns:
+        list[dict]: {"kind", "name", "path", "error"} per PDF
+    """
+    sheets = load_sheets(["Users", "Tasks"])
+    users, tasks = sheets["Users"], sheets["Tasks"]
+    if "AssignedTo" in tasks.columns:
+        tasks["AssignedTo"] = pd.to_numeric(tasks["AssignedTo"], errors="coerce")
+
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = build_jobs(users, tasks, output_dir)
+    print(f"🖨️  Rendering {len(jobs)} PDF(s) into {output_dir}")
+
+    if max_workers == 1 or len(jobs) < 2:
+        results = [_render(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = [f.result() for f in as_completed([pool.submit(_render, job) for job in jobs])]
+
+    failed = [r for r in results if r["error"]]
+    for r in failed:
+        print(f"❌ {r['kind']} '{r['name']}': {r['error']}")
+    print(f"✅ Rendered {len(results) - len(failed)}/{len(results)} PDF(s)")
+    return results
+
+
+if __name__ == "__main__":
+    render_all_reports(max_workers=int(sys.argv[1]) if len(sys.argv) > 1 else None)
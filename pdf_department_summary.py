@@ -1,23 +1,22 @@
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
 from reportlab.lib import colors
 from datetime import date
 import pandas as pd
 import yaml
+from mom_data import load_sheets
+from branding import draw_logo
 
 # Load config
 with open("config.yaml", "r") as f:
     config = yaml.safe_load(f)
 
-logo_url = config["branding"]["logo_url"]
 MOM_FILE = config["paths"]["mom_file"]
 
 
 def load_data():
-    tasks = pd.read_excel(MOM_FILE, sheet_name="Tasks")
-    users = pd.read_excel(MOM_FILE, sheet_name="Users")
-    return tasks, users
+    sheets = load_sheets(["Tasks", "Users"])
+    return sheets["Tasks"], sheets["Users"]
 
 
 def generate_department_summary(dept_name, output="DepartmentSummary.pdf"):
@@ -28,10 +27,14 @@ def generate_department_summary(dept_name, output="DepartmentSummary.pdf"):
     dept_ids = dept_users["UserID"].tolist()
 
     dept_tasks = tasks[tasks["AssignedTo"].isin(dept_ids)]
+    return render_department_summary(dept_name, dept_tasks, output)
 
+
+def render_department_summary(dept_name, dept_tasks, output="DepartmentSummary.pdf"):
+    """Draw the department PDF from an already-filtered task frame"""
     completed = dept_tasks[dept_tasks["Status"] == "completed"]
     pending = dept_tasks[dept_tasks["Status"] == "pending"]
-    overdue = dept_tasks[(dept_tasks["Deadline"] < date.today()) & (dept_tasks["Status"] == "pending")]
+    overdue = dept_tasks[(dept_tasks["Deadline"] < pd.Timestamp(date.today())) & (dept_tasks["Status"] == "pending")]
 
     # PDF
     c = canvas.Canvas(output, pagesize=A4)
@@ -39,10 +42,7 @@ def generate_department_summary(dept_name, output="DepartmentSummary.pdf"):
     y = height - 50
 
     # Logo
-    try:
-        c.drawImage(ImageReader(logo_url), 230, y - 50, width=140)
-    except:
-        pass
+    draw_logo(c, 230, y - 50, width=140)
 
     y -= 120
 
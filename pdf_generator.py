@@ -1,10 +1,11 @@
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
 from reportlab.lib import colors
 from datetime import date
 import pandas as pd
 import yaml
+from mom_data import load_sheets
+from branding import draw_logo
 
 # ---------------------------------------------------------
 # Load config
@@ -12,16 +13,14 @@ import yaml
 with open("config.yaml", "r") as f:
     config = yaml.safe_load(f)
 
-logo_url = config["branding"]["logo_url"]
 MOM_FILE = config["paths"]["mom_file"]
 
 # ---------------------------------------------------------
 # Load data from Excel
 # ---------------------------------------------------------
 def load_data():
-    tasks = pd.read_excel(MOM_FILE, sheet_name="Tasks")
-    users = pd.read_excel(MOM_FILE, sheet_name="Users")
-    return tasks, users
+    sheets = load_sheets(["Tasks", "Users"])
+    return sheets["Tasks"], sheets["Users"]
 
 # ---------------------------------------------------------
 # Draw section title
@@ -62,11 +61,7 @@ def generate_mom_pdf(output_path="MoM_Summary.pdf"):
     # -----------------------------------------------------
     # LOGO
     # -----------------------------------------------------
-    try:
-        logo = ImageReader(logo_url)
-        c.drawImage(logo, 230, y - 50, width=140, preserveAspectRatio=True)
-    except:
-        pass
+    draw_logo(c, 230, y - 50, width=140, preserveAspectRatio=True)
 
     y -= 120
 
@@ -98,7 +93,7 @@ def generate_mom_pdf(output_path="MoM_Summary.pdf"):
     # -----------------------------------------------------
     # Overdue Tasks
     # -----------------------------------------------------
-    overdue = tasks[(tasks["Status"] != "completed") & (tasks["Deadline"] < date.today())]
+    overdue = tasks[(tasks["Status"] != "completed") & (tasks["Deadline"] < pd.Timestamp(date.today()))]
     y = section_title(c, "🔥 Overdue Tasks", y)
     y = draw_tasks(c, overdue, y - 10)
 
@@ -1,10 +1,11 @@
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
 from reportlab.lib import colors
 from datetime import date
 import pandas as pd
 import yaml
+from mom_data import load_sheets
+from branding import draw_logo
 
 # ---------------------------------------------------------
 # Load Configuration
@@ -12,7 +13,6 @@ import yaml
 with open("config.yaml", "r") as f:
     config = yaml.safe_load(f)
 
-logo_url = config["branding"]["logo_url"]
 MOM_FILE = config["paths"]["mom_file"]
 
 
@@ -20,9 +20,8 @@ MOM_FILE = config["paths"]["mom_file"]
 # Load Data
 # ---------------------------------------------------------
 def load_data():
-    users = pd.read_excel(MOM_FILE, sheet_name="Users")
-    tasks = pd.read_excel(MOM_FILE, sheet_name="Tasks")
-    return users, tasks
+    sheets = load_sheets(["Users", "Tasks"])
+    return sheets["Users"], sheets["Tasks"]
 
 
 # ---------------------------------------------------------
@@ -31,19 +30,24 @@ def load_data():
 def generate_user_score_pdf(user_name, output="UserScore.pdf"):
 
     users, tasks = load_data()
-    width, height = A4
-    c = canvas.Canvas(output, pagesize=A4)
 
     # Get user record
     user = users[users["Name"] == user_name].iloc[0]
     user_id = int(user["UserID"])
-    dept = user["Department"]
 
     # Get user tasks
     my_tasks = tasks[tasks["AssignedTo"] == user_id]
+    return render_user_score_pdf(user_name, user["Department"], my_tasks, output)
+
+
+def render_user_score_pdf(user_name, dept, my_tasks, output="UserScore.pdf"):
+    """Draw the score PDF from an already-filtered task frame"""
+    width, height = A4
+    c = canvas.Canvas(output, pagesize=A4)
+
     completed = my_tasks[my_tasks["Status"] == "completed"]
     pending = my_tasks[my_tasks["Status"] == "pending"]
-    overdue = my_tasks[(my_tasks["Deadline"] < date.today()) & (my_tasks["Status"] == "pending")]
+    overdue = my_tasks[(my_tasks["Deadline"] < pd.Timestamp(date.today())) & (my_tasks["Status"] == "pending")]
 
     # Compute score
     if len(my_tasks) > 0:
@@ -57,10 +61,7 @@ def generate_user_score_pdf(user_name, output="UserScore.pdf"):
     y = height - 50
 
     # Logo
-    try:
-        c.drawImage(ImageReader(logo_url), 230, y - 50, width=140)
-    except:
-        pass
+    draw_logo(c, 230, y - 50, width=140)
 
     y -= 120
 
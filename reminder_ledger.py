@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+SENT-REMINDER LEDGER
+- Remembers which reminders were already sent, keyed by
+  (TaskID, reminder slot, recipient)
+- A slot is a date + one of reminders.send_times, e.g. "2026-10-18 09:30",
+  both in reminders.timezone (not the host clock: CI runners are on UTC)
+- Lives in the storage.state_db_file SQLite database (WAL mode), apart
+  from the task store, so CI can persist it without freezing the tasks
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import yaml
+
+# ---------------------------------------------------------
+# Load config
+# ---------------------------------------------------------
+with open("config.yaml", "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+
+DB_FILE = config.get("storage", {}).get("state_db_file", "MoM_State.db")
+REMINDERS = config.get("reminders", {})
+SEND_TIMES = sorted(REMINDERS.get("send_times", []) or ["00:00"])
+TIMEZONE = ZoneInfo(REMINDERS.get("timezone", "Asia/Kolkata"))
+KEEP_DAYS = int(REMINDERS.get("keep_days", 30))
+
+
+def current_slot(now=None, send_times=SEND_TIMES):
+    """
+    Latest reminder slot at or before `now` (default: the current time
+    in reminders.timezone)
+
+    Runs before the first send time of the day belong to the previous
+    day's last slot.
+    """
+    now = now or datetime.now(TIMEZONE)
+    hhmm = now.strftime("%H:%M")
+    passed = [t for t in send_times if t <= hhmm]
+    if passed:
+        return f"{now:%Y-%m-%d} {passed[-1]}"
+    return f"{now - timedelta(days=1):%Y-%m-%d} {send_times[-1]}"
+
+
+class ReminderLedger:
+    """Persistent set of (TaskID, Slot, Recipient) already sent"""
+
+    def __init__(self, db_file=DB_FILE):
+        self.db_file = db_file
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sent_reminders (
+                    TaskID TEXT NOT NULL,
+                    Slot TEXT NOT NULL,
+                    Recipient TEXT NOT NULL,
+                    SentAt TEXT NOT NULL,
+                    PRIMARY KEY (TaskID, Slot, Recipient)
+                )
+            """)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_file, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def sent_keys(self, slot):
+        """All (TaskID, Slot, Recipient) sent in `slot`, as a set for O(1) lookups"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT TaskID, Slot, Recipient FROM sent_reminders WHERE Slot = ?", (slot,)
+            ).fetchall()
+        return set(rows)
+
+    def record(self, keys):
+        """Mark (TaskID, Slot, Recipient) keys as sent"""
+        keys = list(keys)
+        if not keys:
+            return 0
+        sent_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO sent_reminders VALUES (?, ?, ?, ?)",
+                [(str(task_id), slot, recipient, sent_at) for task_id, slot, recipient in keys]
+            )
+        return len(keys)
+
+    def prune(self, keep_days=KEEP_DAYS):
+        """Drop ledger rows older than `keep_days`"""
+        cutoff = (datetime.now(TIMEZONE) - timedelta(days=keep_days)).strftime("%Y-%m-%d")
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM sent_reminders WHERE Slot < ?", (cutoff,)).rowcount
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+REPLY STATUS CLASSIFIER
+- One compiled regex finds every status keyword in a single pass over the
+  lower-cased reply: the phrases are merged into a character trie (no
+  backtracking across alternatives, longest phrase still wins) that is
+  only tried after a word separator
+- Quoted history ("> ...", "On ... wrote:", "-----Original Message-----")
+  is stripped first, so the original task mail never votes
+- Negated ("not completed", "haven't started") and conditional
+  ("on hold until done") keywords are ignored; only hits are checked
+- Returns the winning status with a 0..1 confidence
+"""
+
+import re
+
+# Keyword detection patterns
+KEYWORDS = {
+    'in_progress': [
+        'working on', 'started', 'in progress', 'begun', 'working',
+        'i am working', "i'm working", 'started working'
+    ],
+    'completed': [
+        'completed', 'done', 'finished', 'complete', 'closed',
+        'resolved', 'accomplished', 'delivered'
+    ],
+    'delayed': [
+        'delayed', 'delay', 'need more time', 'extension needed',
+        'cannot complete', 'running late', 'behind schedule'
+    ],
+    'on_hold': [
+        'on hold', 'hold', 'waiting for', 'dependency', 'blocked',
+        'paused', 'pending approval', 'awaiting'
+    ]
+}
+
+# Words that flip / suspend the keyword that follows them (same clause)
+NEGATIONS = {
+    'not', 'no', 'never', 'yet', "isn't", "hasn't", "haven't", "wasn't",
+    "didn't", "don't", "doesn't", "won't", "can't", 'cannot', 'without'
+}
+CONDITIONALS = {'until', 'till', 'once', 'when', 'after', 'before', 'if', 'will'}
+LOOKBEHIND_WORDS = 3
+
+MIN_CONFIDENCE = 0.5
+
+# Quoted history starts a line: matched at the very start, or after a
+# newline (a literal prefix the regex engine finds without trying every
+# position, unlike a MULTILINE ^)
+_QUOTE_MARKER = r'\s*(>|on .{0,200}wrote:|-{2,}\s*original message\s*-{2,}|_{5,}|from:\s.+@)'
+_QUOTE_AT_START = re.compile(_QUOTE_MARKER, re.IGNORECASE)
+_QUOTE_AFTER_NEWLINE = re.compile('\n' + _QUOTE_MARKER, re.IGNORECASE)
+
+# The clause before a keyword is read backwards (the window reversed), so
+# one anchored match looks at the nearest LOOKBEHIND_WORDS words only;
+# clause breaks are punctuation, a newline or "but" ("tub" reversed)
+_NOT_WORD = r"[^a-z'.!?;,\n]"
+_SUPPRESSED_REVERSED = re.compile(
+    rf"{_NOT_WORD}*(?:(?!tub\b)[a-z']+{_NOT_WORD}+){{0,{LOOKBEHIND_WORDS - 1}}}"
+    rf"(?:{'|'.join(sorted(w[::-1] for w in NEGATIONS | CONDITIONALS))}|t'n[a-z']*)(?![a-z'])"
+)
+_LOOKBEHIND_CHARS = 80
+
+# ASCII characters that end a word (anything but [\w'])
+_ASCII_SEPARATORS = ''.join(c for c in map(chr, range(128)) if not re.match(r"[\w']", c))
+
+
+def _trie(phrases):
+    """Regex for a set of phrases, merged character by character"""
+    root = {}
+    for phrase in phrases:
+        node = root
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node):
+        branches = [
+            (r'\s+' if char == ' ' else re.escape(char)) + emit(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A phrase may end here: the longer continuation is tried first
+        return f"(?:{body})?" if '' in node else body
+
+    return emit(root)
+
+
+def _compile(keywords):
+    phrase_status = {}
+    for status, phrases in keywords.items():
+        for phrase in phrases:
+            phrase_status.setdefault(' '.join(phrase.lower().split()), status)
+    trie = _trie(phrase_status)
+    # ASCII text (nearly every reply) is scanned separator by separator: a
+    # plain character class lets the regex engine skip ahead in C. Other
+    # text needs the Unicode-aware lookbehind.
+    ascii_pattern = re.compile(rf"[{re.escape(_ASCII_SEPARATORS)}]({trie})(?![\w'])")
+    unicode_pattern = re.compile(rf"(?<![\w'])({trie})(?![\w'])")
+    return ascii_pattern, unicode_pattern, phrase_status
+
+
+_ASCII_PATTERN, _UNICODE_PATTERN, _PHRASE_STATUS = _compile(KEYWORDS)
+
+
+def strip_quoted_reply(body):
+    """Only the new text of a reply (everything above the quoted history)"""
+    body = body or ''
+    if _QUOTE_AT_START.match(body):
+        return ''
+    match = _QUOTE_AFTER_NEWLINE.search(body)
+    return body[:match.start() + 1] if match else body
+
+
+def _suppressed(text, start):
+    """True if the keyword at `start` of (lower-cased) `text` is negated or conditional"""
+    window = text[max(start - _LOOKBEHIND_CHARS, 0):start][::-1]
+    return _SUPPRESSED_REVERSED.match(window) is not None
+
+
+def classify_status(body):
+    """
+    Classify a reply body
+
+    Returns:
+        (status, confidence): status is a KEYWORDS key or None,
+        confidence 0..1 (agreeing / specific phrases score higher)
+    """
+    # Leading space: a keyword at the very start still follows a separator
+    text = ' ' + strip_quoted_reply(body).lower()
+    search = (_ASCII_PATTERN if text.isascii() else _UNICODE_PATTERN).search
+    scores = {}
+    match = search(text)
+    while match:
+        start, end = match.span(1)
+        phrase = match.group(1)
+        match = search(text, end)  # the next keyword may follow right after
+        if _suppressed(text, start):
+            continue
+        status = _PHRASE_STATUS.get(phrase)
+        if status is None:  # irregular whitespace inside the phrase
+            phrase = ' '.join(phrase.split())
+            status = _PHRASE_STATUS[phrase]
+        # Multi-word phrases are more specific than single words
+        scores[status] = scores.get(status, 0) + 1 + 0.5 * phrase.count(' ')
+
+    if not scores:
+        return None, 0.0
+    if len(scores) == 1:
+        (status, score), = scores.items()
+        return status, round(score / (score + 0.5), 2)
+    status = max(scores, key=scores.get)
+    confidence = scores[status] / (sum(scores.values()) + 0.5)
+    return status, round(confidence, 2)
@@ -19,15 +19,21 @@ import json
 load_dotenv()
 
 # Import custom modules
-from mom_agent import add_task, send_email
+from mom_agent import add_task, add_tasks, send_email
 from email_engine import send_email
+from task_store import get_task_store
+from task_log import TaskLog
+from mom_data import dataset_version, load_sheets
+from task_cube import TaskCube, apply_changes, get_cube
+from branding import logo_path
 
 # ============= CONFIGURATION =============
 with open('config.yaml', 'r', encoding='utf-8') as f:
     config = yaml.safe_load(f)
 
 MOM_FILE = config['paths']['mom_file']
-LOGO_PATH = config['branding'].get('logo_url', '')
+LOGO_PATH = logo_path() or config['branding'].get('logo_url', '')
+PAGE_SIZE = int(config.get('dashboard', {}).get('page_size', 50))
 
 # ============= PAGE CONFIG =============
 st.set_page_config(
@@ -74,42 +80,51 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# ✅ ====== GLOBAL SAFE INITIALIZATION (DO NOT MOVE) ======
+# ✅ ====== LAZY DATA (loaded per view, cached per dataset version) ======
+EMPTY_TASKS = pd.DataFrame(columns=[
+    "TaskID", "MeetingID", "Title", "Details",
+    "Department", "AssignedTo", "Status",
+    "Deadline", "CreatedDate", "CreatedBy", "Category"
+])
 
+@st.cache_data(max_entries=16, show_spinner=False)
+def load_sheet(name, version):
+    """One sheet (Tasks from the task store); `version` is the cache key"""
+    df = load_sheets([name])[name]
+    # ✅ Ensure Tasks always has structure
+    if name == 'Tasks' and (df is None or df.empty):
+        return EMPTY_TASKS.copy()
+    return df
+
+def sheet(name):
+    """Sheet for its current dataset version (re-read only when that sheet changed)"""
+    try:
+        return load_sheet(name, dataset_version(name))
+    except Exception as e:
+        print(f"❌ CRITICAL LOAD ERROR ({name}):", e)
+        return EMPTY_TASKS.copy() if name == 'Tasks' else pd.DataFrame()
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def task_view(kind, version):
+    """Task subsets used by single views, memoized per Tasks version"""
+    tasks = load_sheet('Tasks', version)
+    if kind == 'recent':
+        return tasks.sort_values('CreatedDate', ascending=False).head(10)
+    if kind == 'boss':
+        # FIX: Handle missing Category column gracefully
+        if 'Category' in tasks.columns:
+            return tasks[tasks['Category'] == 'Boss-MoM']
+        return tasks[tasks['Title'].astype(str).str.contains('Boss', case=False, na=False)]
+    # 'Executive' / 'Manager'
+    return tasks[tasks['AssignedTo'].astype(str).str.contains(kind, case=False, na=False)]
+
+# ✅ Aggregate cube for every count below (rebuilt only when the data changes)
 try:
-    @st.cache_data(ttl=60)
-    def load_data():
-        xls = pd.ExcelFile(MOM_FILE)
-
-        users = pd.read_excel(xls, 'Users') if 'Users' in xls.sheet_names else pd.DataFrame()
-        tasks = pd.read_excel(xls, 'Tasks') if 'Tasks' in xls.sheet_names else pd.DataFrame()
-        meetings = pd.read_excel(xls, 'Meetings') if 'Meetings' in xls.sheet_names else pd.DataFrame()
-        logs = pd.read_excel(xls, 'Logs') if 'Logs' in xls.sheet_names else pd.DataFrame()
-        escalations = pd.read_excel(xls, 'Escalations') if 'Escalations' in xls.sheet_names else pd.DataFrame()
-
-        # ✅ Ensure Tasks always has structure
-        if tasks is None or tasks.empty:
-            tasks = pd.DataFrame(columns=[
-                "TaskID", "MeetingID", "Title", "Details",
-                "Department", "AssignedTo", "Status",
-                "Deadline", "CreatedDate", "CreatedBy", "Category"
-            ])
-
-        return users, tasks, meetings, logs, escalations
-
-    users, tasks, meetings, logs, escalations = load_data()
-
+    cube = get_cube()
 except Exception as e:
-    print("❌ CRITICAL LOAD ERROR:", e)
-    users = pd.DataFrame()
-    tasks = pd.DataFrame(columns=[
-        "TaskID", "MeetingID", "Title", "Details",
-        "Department", "AssignedTo", "Status",
-        "Deadline", "CreatedDate", "CreatedBy", "Category"
-    ])
-    meetings = pd.DataFrame()
-    logs = pd.DataFrame()
-    escalations = pd.DataFrame()
+    print("⚠️ Task cube unavailable, counting loaded tasks:", e)
+    cube = TaskCube(sheet('Tasks'))
+stats = cube.summary()
 
 # ============= HEADER =============
 st.markdown(f'<h1 class="main-header">📋 {config["branding"]["dashboard_title"]}</h1>', unsafe_allow_html=True)
@@ -126,20 +141,17 @@ with st.sidebar:
     
     # Refresh Data Button
     if st.button("🔄 Refresh Data", key="refresh_data"):
-        st.cache_data.clear()
+        load_sheet.clear()
+        task_view.clear()
         st.rerun()
     
     st.markdown("---")
     
     # Status Summary
     st.markdown("### 📊 Quick Stats")
-    total_tasks = len(tasks)
-    pending_tasks = len(tasks[tasks['Status'] == 'pending'])
-    completed_tasks = len(tasks[tasks['Status'] == 'completed'])
-    
-    st.metric("Total Tasks", total_tasks)
-    st.metric("Pending", pending_tasks)
-    st.metric("Completed", completed_tasks)
+    st.metric("Total Tasks", stats["total"])
+    st.metric("Pending", stats["pending"])
+    st.metric("Completed", stats["completed"])
     
     st.markdown("---")
     
@@ -150,15 +162,18 @@ with st.sidebar:
     st.markdown("#### 🧹 Reset Testing Data")
     if st.button("🗑️ Clear All Testing Data", key="reset_testing"):
         try:
-            df = pd.read_excel(MOM_FILE, sheet_name='Tasks')
-            testing_count = len(df[df['Status'] == 'testing'])
+            before = dataset_version('Tasks')
+            tasks = sheet('Tasks')
+            testing_rows = tasks[tasks['Status'].astype(str) == 'testing'].to_dict('records')
+            testing_count = get_task_store().delete_tasks_by_status('testing')
+            apply_changes(before, removed=testing_rows)
+            TaskLog().append([
+                {"TaskID": row['TaskID'], "Action": "deleted", "Actor": os.getenv('OWNER_EMAIL', 'System'), "Notes": "Testing data purge"}
+                for row in testing_rows
+            ])
             
             if testing_count > 0:
-                df_clean = df[df['Status'] != 'testing'].copy()
-                with pd.ExcelWriter(MOM_FILE, mode='a', if_sheet_exists='overlay', engine='openpyxl') as writer:
-                    df_clean.to_excel(writer, sheet_name='Tasks', index=False)
                 st.success(f"✅ Deleted {testing_count} testing task(s)")
-                st.cache_data.clear()
                 st.rerun()
             else:
                 st.info("ℹ️ No testing data found")
@@ -192,13 +207,13 @@ with st.sidebar:
             try:
                 process_inbox_replies()
                 st.success("✅ Inbox processed successfully")
-                st.cache_data.clear()
                 st.rerun()
             except Exception as e:
                 st.error(f"❌ Error: {e}")
 
-# ============= MAIN TABS =============
-tabs = st.tabs([
+# ============= MAIN VIEWS =============
+# Only the selected view runs (st.tabs would execute all ten on every rerun)
+VIEWS = [
     "📊 Dashboard",
     "📝 All Tasks",
     "👔 Boss-MoM",
@@ -209,43 +224,41 @@ tabs = st.tabs([
     "👤 Executive",
     "👨‍💼 Manager",
     "📈 Performance"
-])
+]
+view = st.radio("View", VIEWS, horizontal=True, key="view", label_visibility="collapsed")
+st.markdown("---")
 
 # ============= TAB 1: DASHBOARD =============
-with tabs[0]:
+if view == VIEWS[0]:
     st.markdown("### 📊 Overview Summary")
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("Total Tasks", len(tasks))
+        st.metric("Total Tasks", stats["total"])
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
-        pending = len(tasks[tasks['Status'] == 'pending'])
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("Pending", pending)
+        st.metric("Pending", stats["pending"])
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col3:
-        completed = len(tasks[tasks['Status'] == 'completed'])
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("Completed", completed)
+        st.metric("Completed", stats["completed"])
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col4:
-        today = pd.Timestamp.now().normalize()
-        overdue = len(tasks[(tasks['Status'] == 'pending') & (tasks['Deadline'] < today)])
         st.markdown('<div class="metric-card overdue-card">', unsafe_allow_html=True)
-        st.metric("Overdue", overdue)
+        st.metric("Overdue", stats["overdue"])
         st.markdown('</div>', unsafe_allow_html=True)
     
     st.markdown("---")
     
     # Recent Tasks
     st.markdown("### 📋 Recent Tasks")
-    recent_tasks = tasks.sort_values('CreatedDate', ascending=False).head(10)
+    recent_tasks = task_view('recent', dataset_version('Tasks'))
     display_cols = [
          "TaskID", 
         "MeetingID",
@@ -256,51 +269,77 @@ with tabs[0]:
         "Status",
         "Deadline"
     ]
-    st.dataframe(tasks[display_cols], use_container_width=True)
+    st.dataframe(recent_tasks[display_cols], use_container_width=True)
 
 # ============= TAB 2: ALL TASKS =============
-with tabs[1]:
+if view == VIEWS[1]:
     st.markdown("### 📝 All Tasks")
     
-    col1, col2 = st.columns(2)
+    # Filter options come from the cube; rows are fetched one page at a time
+    status_options = sorted(v for v in cube.counts_by('Status').index if v)
+    dept_options = sorted(v for v in cube.counts_by('Department').index if v)
+    
+    col1, col2, col3 = st.columns([2, 2, 3])
     with col1:
-        status_filter = st.multiselect("Status", options=tasks['Status'].unique(), default=tasks['Status'].unique())
+        status_filter = st.multiselect("Status", options=status_options, default=status_options)
     with col2:
-        dept_filter = st.multiselect("Department", options=tasks['Department'].unique(), default=tasks['Department'].unique())
+        dept_filter = st.multiselect("Department", options=dept_options, default=dept_options)
+    with col3:
+        search = st.text_input("Search", placeholder="TaskID, title, assignee...").strip()
     
-    filtered_tasks = tasks[
-        (tasks['Status'].isin(status_filter)) &
-        (tasks['Department'].isin(dept_filter))
-    ]
+    # Unfiltered multiselects mean "all" (also keeps tasks with a blank status / department)
+    query = {
+        "search": search or None,
+        "statuses": None if set(status_filter) == set(status_options) else status_filter,
+        "departments": None if set(dept_filter) == set(dept_options) else dept_filter,
+    }
     
-    # Display checkboxes for each task
-    task_ids_to_delete = []
-    for i, task in filtered_tasks.iterrows():
-        # Use a fallback if TaskID is NaN or invalid
-        task_id = task['TaskID'] if pd.notna(task['TaskID']) else f"Unknown_{i}"
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page = st.number_input("Page", min_value=1, value=1, step=1, key="all_tasks_page")
     
-        # Create a unique key for each checkbox using task_id and index
-        checkbox = st.checkbox(f"Delete task {task['TaskID']} - {task['Title']}", key=f"{task_id}_{i}")
+    store = get_task_store()
+    page_tasks, total_matches = store.query_tasks(limit=PAGE_SIZE, offset=(page - 1) * PAGE_SIZE, **query)
+    page_count = max(1, -(-total_matches // PAGE_SIZE))
+    if page > page_count:
+        page = page_count
+        page_tasks, total_matches = store.query_tasks(limit=PAGE_SIZE, offset=(page - 1) * PAGE_SIZE, **query)
     
-        if checkbox:
-            task_ids_to_delete.append(task['TaskID'])
-
-    # Display the filtered tasks in a table
-    st.dataframe(filtered_tasks, use_container_width=True)
+    with col2:
+        offset = (page - 1) * PAGE_SIZE
+        st.caption(
+            f"Showing {offset + 1 if len(page_tasks) else 0}–{offset + len(page_tasks)} "
+            f"of {total_matches} task(s) · page {page} of {page_count}"
+        )
+    
+    # One editable grid for the page; only the Delete column is editable
+    editor_rows = page_tasks.copy()
+    editor_rows.insert(0, "Delete", False)
+    edited = st.data_editor(
+        editor_rows,
+        key=f"all_tasks_editor_{page}_{hash(str(query))}",
+        hide_index=True,
+        use_container_width=True,
+        disabled=[c for c in editor_rows.columns if c != "Delete"],
+        column_config={"Delete": st.column_config.CheckboxColumn("Delete", default=False)},
+    )
+    task_ids_to_delete = edited.loc[edited["Delete"], "TaskID"].tolist()
 
     # Add a button to delete selected tasks
     if task_ids_to_delete:
-        if st.button("Delete selected tasks"):
+        if st.button(f"Delete {len(task_ids_to_delete)} selected task(s)"):
             try:
-                # Delete tasks from the DataFrame
-                tasks_to_keep = tasks[~tasks['TaskID'].isin(task_ids_to_delete)]
-                
-                # Save the updated tasks back to Excel
-                with pd.ExcelWriter(MOM_FILE, mode='a', if_sheet_exists='replace', engine='openpyxl') as writer:
-                    tasks_to_keep.to_excel(writer, sheet_name='Tasks', index=False)
+                # Delete tasks by TaskID in the store
+                before = dataset_version('Tasks')
+                deleted_rows = page_tasks[page_tasks['TaskID'].isin(task_ids_to_delete)].to_dict('records')
+                store.delete_tasks(task_ids_to_delete)
+                apply_changes(before, removed=deleted_rows)
+                TaskLog().append([
+                    {"TaskID": task_id, "Action": "deleted", "Actor": os.getenv('OWNER_EMAIL', 'System')}
+                    for task_id in task_ids_to_delete
+                ])
                 
                 st.success(f"✅ Successfully deleted {len(task_ids_to_delete)} task(s)!")
-                st.cache_data.clear()
                 st.rerun()
             except Exception as e:
                 st.error(f"❌ Error deleting tasks: {e}")
@@ -308,14 +347,10 @@ with tabs[1]:
         st.write("No tasks selected for deletion.")
 
 # ============= TAB 3: BOSS-MOM =============
-with tabs[2]:
+if view == VIEWS[2]:
     st.markdown("### 👔 Boss-MoM Tasks")
     
-    # FIX: Handle missing Category column gracefully
-    if 'Category' in tasks.columns:
-        boss_tasks = tasks[tasks['Category'] == 'Boss-MoM']
-    else:
-        boss_tasks = tasks[tasks['Title'].astype(str).str.contains('Boss', case=False, na=False)]
+    boss_tasks = task_view('boss', dataset_version('Tasks'))
     
     if len(boss_tasks) > 0:
         st.dataframe(boss_tasks, use_container_width=True)
@@ -323,34 +358,17 @@ with tabs[2]:
         st.info("ℹ️ No Boss-MoM tasks found")
 
 # ============= TAB 4: DEPARTMENTS =============
-with tabs[3]:
+if view == VIEWS[3]:
     st.markdown("### 🏢 Department Dashboard")
     
-    # Step 1: Ensure 'tasks' DataFrame is loaded correctly (as you already did above)
-    tasks = pd.read_excel(MOM_FILE, sheet_name='Tasks')
-
-    # Step 2: Group tasks by 'Department' and calculate 'Total' and 'Completed' counts
-    # ✅ Build department performance first
-    dept_perf = tasks.groupby('Department').agg({
-        'TaskID': 'count',
-        'Status': lambda x: (x == 'completed').sum()
-    }).rename(columns={'TaskID': 'Total', 'Status': 'Completed'})
-
-    # ✅ Convert to numeric safely
-    dept_perf['Completed'] = pd.to_numeric(dept_perf['Completed'], errors='coerce').fillna(0)
-    dept_perf['Total'] = pd.to_numeric(dept_perf['Total'], errors='coerce').fillna(0)
-
-    # ✅ Avoid division errors
-    dept_perf['Completion %'] = dept_perf.apply(
-        lambda r: round((r['Completed'] / r['Total'] * 100), 1) if r['Total'] > 0 else 0,
-        axis=1
-    )
+    # ✅ Total / Completed / Completion % per department, straight from the cube
+    dept_perf = cube.department_performance()[['Total', 'Completed', 'Completion %']]
 
     # ✅ Display safely
     st.dataframe(dept_perf, use_container_width=True)
 
 # ============= TAB 5: ADD TASK =============
-with tabs[4]:
+if view == VIEWS[4]:
     st.markdown("### ➕ Add New MoM Task")
     
     with st.form("add_task_form"):
@@ -378,7 +396,6 @@ with tabs[4]:
                         category=category
                     )
                     st.success("✅ Task added successfully!")
-                    st.cache_data.clear()
                     st.rerun()
                 except Exception as e:
                     st.error(f"❌ Error: {e}")
@@ -386,12 +403,12 @@ with tabs[4]:
                 st.warning("⚠️ Please fill required fields")
 
 # ============= TAB 6: ESCALATIONS =============
-with tabs[5]:
+if view == VIEWS[5]:
     st.markdown("### ⚠️ Escalation Log")
-    st.dataframe(escalations, use_container_width=True)
+    st.dataframe(sheet('Escalations'), use_container_width=True)
 
 # ============= TAB 7: AI MOM EXTRACTOR =============
-with tabs[6]:
+if view == VIEWS[6]:
     st.markdown("### 🤖 AI MoM Extractor")
 
     api_key = os.getenv("OPENAI_API_KEY")
@@ -530,68 +547,13 @@ Meeting Notes:
         st.markdown(f"**Ready to save {len(st.session_state['ai_tasks'])} tasks**")
         
         if st.button("💾 Save All Extracted Tasks", type="primary"):
-            saved = 0
-            failed = 0
-            errors = []
-
-            for i, task in enumerate(st.session_state["ai_tasks"], 1):
-                try:
-                    # Convert deadline string to datetime
-                    deadline_str = str(task.get("deadline", "")).strip().upper()
-
-                    if deadline_str in ["TBD", "", "NONE", "MONTHLY", "NULL"]:
-                        deadline_obj = datetime.today() + timedelta(days=7)
-                    else:
-                        try:
-                            deadline_obj = datetime.strptime(deadline_str, "%Y-%m-%d")
-                        except:
-                            deadline_obj = datetime.today() + timedelta(days=7)
-
-                    # Save task
-                    task_id = add_task(
-                        meeting_id="AI-Extract",
-                        title=task.get("title", "Untitled"),
-                        details=task.get("details", ""),
-                        department=task.get("department", "General"),
-                        assigned_to=task.get("assigned_to", "Unassigned"),
-                        created_by="AI-Agent",
-                        deadline=deadline_obj,
-                        category="Regular"
-                    )
-
-                    if task_id:
-                        saved += 1
-                    else:
-                        failed += 1
-                        errors.append(f"Task {i}: Save returned no ID")
-
-                except Exception as e:
-                    failed += 1
-                    errors.append(f"Task {i} '{task.get('title', 'Unknown')}': {e}")
-
-            # Show results
-            if saved > 0:
-                st.success(f"✅ Successfully saved {saved}/{len(st.session_state['ai_tasks'])} tasks!")
-            if failed > 0:
-                st.warning(f"⚠️ {failed} tasks failed to save")
-                with st.expander("View Error Details"):
-                    for error in errors:
-                        st.text(error)
-
-            # Clear and refresh
-            del st.session_state["ai_tasks"]
-            st.cache_data.clear()
-            st.rerun()
-
-    # ✅ SAFE SAVE BUTTON (NO NAMEERROR NOW)
-    if "ai_tasks" in st.session_state:
-        if st.button("💾 Save All Extracted Tasks"):
-            saved = 0
+            items = []
 
             for task in st.session_state["ai_tasks"]:
-                deadline_str = str(task.get("deadline", "")).strip()
+                # Convert deadline string to datetime
+                deadline_str = str(task.get("deadline", "")).strip().upper()
 
-                if deadline_str.upper() in ["TBD", "", "NONE", "MONTHLY"]:
+                if deadline_str in ["TBD", "", "NONE", "MONTHLY", "NULL"]:
                     deadline_obj = datetime.today() + timedelta(days=7)
                 else:
                     try:
@@ -599,28 +561,42 @@ Meeting Notes:
                     except:
                         deadline_obj = datetime.today() + timedelta(days=7)
 
-                add_task(
-                    meeting_id="AI-Extract",
-                    title=task.get("title", "Untitled"),
-                    details=task.get("details", ""),
-                    department=task.get("department", "General"),
-                    assigned_to=task.get("assigned_to", "Unassigned"),
-                    created_by="AI-Agent",
-                    deadline=deadline_obj,
-                    category="Regular"
-                )
+                items.append({
+                    "meeting_id": "AI-Extract",
+                    "title": task.get("title", "Untitled"),
+                    "details": task.get("details", ""),
+                    "department": task.get("department", "General"),
+                    "assigned_to": task.get("assigned_to", "Unassigned"),
+                    "created_by": "AI-Agent",
+                    "deadline": deadline_obj,
+                    "category": "Regular"
+                })
+
+            # Save all tasks in one write + one mail session
+            results = add_tasks(items)
+            saved = sum(1 for r in results if r["task_id"])
+            errors = [
+                f"Task {r['index'] + 1} '{r['title'] or 'Unknown'}': {r['error']}"
+                for r in results if r["error"]
+            ]
 
-                saved += 1
+            # Show results
+            if saved > 0:
+                st.success(f"✅ Successfully saved {saved}/{len(st.session_state['ai_tasks'])} tasks!")
+            if errors:
+                st.warning(f"⚠️ {len(errors)} tasks failed to save")
+                with st.expander("View Error Details"):
+                    for error in errors:
+                        st.text(error)
 
-            st.success(f"✅ Successfully saved {saved} AI tasks!")
+            # Refresh (the Tasks version changed, so only task data reloads)
             del st.session_state["ai_tasks"]
-            st.cache_data.clear()
             st.rerun()
 
 # ============= TAB 8: EXECUTIVE =============
-with tabs[7]:
+if view == VIEWS[7]:
     st.markdown("### 👤 Executive Dashboard")
-    exec_tasks = tasks[tasks['AssignedTo'].astype(str).str.contains('Executive', case=False, na=False)]
+    exec_tasks = task_view('Executive', dataset_version('Tasks'))
     
     if len(exec_tasks) > 0:
         st.dataframe(exec_tasks, use_container_width=True)
@@ -635,9 +611,9 @@ with tabs[7]:
         st.info("ℹ️ No executive tasks")
 
 # ============= TAB 9: MANAGER =============
-with tabs[8]:
+if view == VIEWS[8]:
     st.markdown("### 👨‍💼 Manager Dashboard")
-    mgr_tasks = tasks[tasks['AssignedTo'].astype(str).str.contains('Manager', case=False, na=False)]
+    mgr_tasks = task_view('Manager', dataset_version('Tasks'))
     
     if len(mgr_tasks) > 0:
         st.dataframe(mgr_tasks, use_container_width=True)
@@ -652,35 +628,27 @@ with tabs[8]:
         st.info("ℹ️ No manager tasks")
 
 # ============= TAB 10: PERFORMANCE =============
-with tabs[9]:
+if view == VIEWS[9]:
     st.markdown("### 📈 Performance Scorecard")
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        completion_rate = (len(tasks[tasks['Status'] == 'completed']) / len(tasks) * 100) if len(tasks) > 0 else 0
+        completion_rate = (stats["completed"] / stats["total"] * 100) if stats["total"] > 0 else 0
         st.metric("Completion Rate", f"{completion_rate:.1f}%")
     
     with col2:
-        today = pd.Timestamp.now().normalize()
-        overdue_count = len(tasks[(tasks['Status'] == 'pending') & (tasks['Deadline'] < today)])
-        st.metric("Overdue", overdue_count)
+        st.metric("Overdue", stats["overdue"])
     
     with col3:
         st.metric("Avg Time", "N/A")
     
     with col4:
-        st.metric("Active Users", tasks['AssignedTo'].nunique())
+        st.metric("Active Users", cube.active_users())
     
     st.markdown("---")
     st.markdown("#### 🏢 Department Performance")
     
-    dept_perf = tasks.groupby('Department').agg({
-        'TaskID': 'count',
-        'Status': lambda x: (x == 'completed').sum()
-    }).rename(columns={'TaskID': 'Total', 'Status': 'Completed'})
-    
-    dept_perf['Pending'] = dept_perf['Total'] - dept_perf['Completed']
-    dept_perf['Completed'] = pd.to_numeric(dept_perf['Completed'], errors='coerce').fillna(0)
+    dept_perf = cube.department_performance()[['Total', 'Completed', 'Pending']]
     
     st.dataframe(dept_perf, use_container_width=True)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+MULTI-PROCESS WORKBOOK WRITE STRESS TEST
+- Several processes hammer one scratch workbook at the same time:
+  ExcelTaskStore.add_tasks / update_tasks (read → modify → commit with a
+  revision check) and escalation_engine.append_escalations
+- Afterwards every added task, every status update and every escalation
+  row must be present: a lost update means a writer clobbered another
+
+Usage: python stress_workbook_writes.py [processes] [rounds]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from multiprocessing import Pool
+
+import pandas as pd
+
+from auto_create_excel import SHEETS
+from escalation_engine import append_escalations
+from task_store import ExcelTaskStore
+from workbook_cache import _snapshot_root
+
+
+def _worker(args):
+    path, worker, rounds = args
+    store = ExcelTaskStore(path)
+    for i in range(rounds):
+        task_id = f"W{worker}-{i}"
+        store.add_tasks([{"TaskID": task_id, "Title": f"Stress {task_id}", "Status": "pending"}])
+        store.update_tasks({task_id: {"Status": "completed"}})
+        append_escalations([{"TaskID": task_id, "Level": 1}], excel_path=path)
+    return worker
+
+
+def run(processes=4, rounds=10):
+    scratch = tempfile.mkdtemp(prefix="mom-stress-")
+    path = os.path.join(scratch, "MoM_Stress.xlsx")
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        for sheet, columns in SHEETS.items():
+            pd.DataFrame(columns=columns).to_excel(writer, sheet_name=sheet, index=False)
+
+    try:
+        start = time.time()
+        with Pool(processes) as pool:
+            pool.map(_worker, [(path, w, rounds) for w in range(processes)])
+        elapsed = time.time() - start
+
+        tasks = pd.read_excel(path, sheet_name="Tasks")
+        escalations = pd.read_excel(path, sheet_name="Escalations")
+        expected = {f"W{w}-{i}" for w in range(processes) for i in range(rounds)}
+
+        missing = expected - set(tasks["TaskID"].astype(str))
+        not_updated = tasks[tasks["Status"] != "completed"]["TaskID"].tolist()
+        missing_escalations = expected - set(escalations["TaskID"].astype(str))
+
+        print(f"⏱️  {processes} process(es) × {rounds} round(s) in {elapsed:.1f}s")
+        print(f"   Tasks: {len(tasks)}/{len(expected)}, missing {len(missing)}")
+        print(f"   Status updates lost: {len(not_updated)}")
+        print(f"   Escalations: {len(escalations)}/{len(expected)}, missing {len(missing_escalations)}")
+
+        ok = not missing and not not_updated and not missing_escalations and len(tasks) == len(expected)
+        print("✅ No lost updates" if ok else "❌ Lost updates detected")
+        return ok
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+        shutil.rmtree(_snapshot_root(path), ignore_errors=True)
+
+
+if __name__ == "__main__":
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    sys.exit(0 if run(processes, rounds) else 1)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+TASK AGGREGATE CUBE
+- Task counts by Department × Status × AssignedTo × DeadlineBucket × Month
+  (CreatedDate), built with one value_counts() per Tasks version
+- Every dashboard / report metric (status counts, overdue, per-department
+  totals) is answered from the cube instead of filtering the task table
+- In-process writes can be folded in with apply_changes() instead of
+  rebuilding the cube
+"""
+
+import threading
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from mom_data import dataset_version, load_tasks
+from workbook_cache import parse_dates
+
+DIMENSIONS = ["Department", "Status", "AssignedTo", "DeadlineBucket", "Month"]
+DEADLINE_BUCKETS = ["no_deadline", "overdue", "due_today", "due_week", "later"]
+
+
+def _label(value):
+    """Dimension value as a plain string ('' for missing, 2.0 → '2')"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def cube_keys(tasks, today):
+    """Dimension columns for each task row (vectorized)"""
+    deadline = parse_dates(tasks["Deadline"]).dt.normalize()
+    days = (deadline - today).dt.days
+    bucket = np.select(
+        [deadline.isna(), days < 0, days == 0, days <= 7],
+        DEADLINE_BUCKETS[:4],
+        DEADLINE_BUCKETS[4]
+    )
+    created = parse_dates(tasks["CreatedDate"])
+    return pd.DataFrame({
+        "Department": tasks["Department"].astype(object).map(_label),
+        "Status": tasks["Status"].astype(object).map(_label).str.lower(),
+        "AssignedTo": tasks["AssignedTo"].astype(object).map(_label),
+        "DeadlineBucket": bucket,
+        "Month": created.dt.strftime("%Y-%m").fillna(""),
+    }, index=tasks.index)
+
+
+class TaskCube:
+    """Count cube over the task table for one day (deadline buckets depend on it)"""
+
+    def __init__(self, tasks, today=None):
+        self.today = pd.Timestamp(today or date.today()).normalize()
+        self.counts = {}
+        self._frame = None
+        if tasks is not None and len(tasks):
+            grouped = cube_keys(_with_columns(tasks), self.today).value_counts()
+            self.counts = {key: int(n) for key, n in grouped.items()}
+
+    # -----------------------------------------------------
+    # Incremental maintenance
+    # -----------------------------------------------------
+    def _shift(self, rows, delta):
+        rows = pd.DataFrame(list(rows))
+        if rows.empty:
+            return
+        for key in cube_keys(_with_columns(rows), self.today).itertuples(index=False, name=None):
+            count = self.counts.get(key, 0) + delta
+            if count > 0:
+                self.counts[key] = count
+            else:
+                self.counts.pop(key, None)
+        self._frame = None
+
+    def add(self, rows):
+        """Count new task rows (dicts)"""
+        self._shift(rows, 1)
+
+    def remove(self, rows):
+        """Uncount deleted task rows (dicts, as they were before the delete)"""
+        self._shift(rows, -1)
+
+    def update(self, old_rows, new_rows):
+        """Move changed task rows from their old to their new cell"""
+        self.remove(old_rows)
+        self.add(new_rows)
+
+    # -----------------------------------------------------
+    # Queries
+    # -----------------------------------------------------
+    def frame(self):
+        """The cube as a DataFrame: DIMENSIONS + Count"""
+        if self._frame is None:
+            self._frame = pd.DataFrame(
+                [(*key, n) for key, n in self.counts.items()],
+                columns=DIMENSIONS + ["Count"]
+            )
+        return self._frame
+
+    def _select(self, filters):
+        cube = self.frame()
+        mask = pd.Series(True, index=cube.index)
+        for dim, value in filters.items():
+            if isinstance(value, (list, tuple, set, frozenset)):
+                mask &= cube[dim].isin([_label(v) for v in value])
+            else:
+                mask &= cube[dim] == _label(value)
+        return cube[mask]
+
+    def total(self, **filters):
+        """Number of tasks matching e.g. Status="pending", DeadlineBucket="overdue" """
+        return int(self._select(filters)["Count"].sum())
+
+    def counts_by(self, by, **filters):
+        """Task counts grouped by one or more dimensions"""
+        return self._select(filters).groupby(by)["Count"].sum()
+
+    def summary(self, **filters):
+        """{"total", "pending", "completed", "overdue"} (overdue = pending past deadline)"""
+        by_status = self.counts_by("Status", **filters)
+        return {
+            "total": int(by_status.sum()),
+            "pending": int(by_status.get("pending", 0)),
+            "completed": int(by_status.get("completed", 0)),
+            "overdue": self.total(Status="pending", DeadlineBucket="overdue", **filters),
+        }
+
+    def department_performance(self, **filters):
+        """Per department: Total, Completed, Pending (= not completed), Completion %"""
+        cube = self._select(filters)
+        cube = cube[cube["Department"] != ""]
+        perf = pd.DataFrame({
+            "Total": cube.groupby("Department")["Count"].sum(),
+            "Completed": cube[cube["Status"] == "completed"].groupby("Department")["Count"].sum(),
+        }).fillna(0).astype(int)
+        perf["Pending"] = perf["Total"] - perf["Completed"]
+        perf["Completion %"] = (perf["Completed"] / perf["Total"].where(perf["Total"] > 0) * 100).round(1).fillna(0)
+        return perf
+
+    def active_users(self, **filters):
+        users = self.counts_by("AssignedTo", **filters)
+        return int((users.index != "").sum())
+
+
+def _with_columns(tasks):
+    """Fill in any cube column the frame lacks (e.g. a partial task dict)"""
+    missing = [c for c in ["Department", "Status", "AssignedTo", "Deadline", "CreatedDate"] if c not in tasks.columns]
+    if missing:
+        tasks = tasks.assign(**{c: None for c in missing})
+    return tasks
+
+
+# ---------------------------------------------------------
+# Per-version cube (keyed on the Tasks dataset only)
+# ---------------------------------------------------------
+_memo = {"key": None, "cube": None}
+_lock = threading.Lock()
+
+
+def get_cube(today=None):
+    """Cube for the current Tasks version (rebuilt only when the tasks change)"""
+    today = pd.Timestamp(today or date.today()).normalize()
+    key = (dataset_version("Tasks"), today)
+    with _lock:
+        if _memo["key"] != key:
+            _memo["cube"] = TaskCube(load_tasks(), today)
+            _memo["key"] = key
+        return _memo["cube"]
+
+
+def apply_changes(before_version, removed=(), added=()):
+    """
+    Fold an in-process task write into the memoized cube
+
+    Args:
+        before_version: dataset_version("Tasks") taken just before the write
+        removed: task rows (dicts) as they were before the write
+        added: task rows (dicts) as they are after the write
+
+    The delta is applied only when the cube was built from `before_version`
+    and this write is the only one since (the SQLite revision moved to
+    before_version + 1). Otherwise - another writer got in between, or the
+    Excel backend's fingerprint gives no such ordering - the memo is dropped
+    and the next get_cube() rebuilds it.
+    """
+    current = dataset_version("Tasks")
+    with _lock:
+        cube = _memo["cube"]
+        if (cube is None or _memo["key"][0] != before_version
+                or not isinstance(before_version, int) or current != before_version + 1):
+            _memo["cube"] = None
+            _memo["key"] = None
+            return False
+        cube.update(removed, added)
+        _memo["key"] = (current, cube.today)
+        return True
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+TASK EVENT LOG
+- Append-only journal of task mutations (created / status / deleted),
+  one INSERT per event, in the storage.db_file SQLite database (WAL mode)
+- Status changes are journaled first and folded into the Tasks table by
+  compact(): net field changes per task, one store write per compaction
+- Update notes live in the journal instead of being appended to Details
+- Columns follow the Logs sheet (LogID, TaskID, Action, Timestamp, Actor)
+  plus Fields (JSON of the changed columns) and Notes
+
+Usage:
+    python task_log.py compact   # fold pending events into the Tasks table
+    python task_log.py export    # journal → Logs sheet of MoM_Master.xlsx
+"""
+
+import json
+import sqlite3
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+import yaml
+
+from task_store import get_task_store
+from workbook_io import file_lock, write_sheet_atomic
+
+# ---------------------------------------------------------
+# Load config
+# ---------------------------------------------------------
+with open("config.yaml", "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+
+MOM_FILE = config["paths"]["mom_file"]
+DB_FILE = config.get("storage", {}).get("db_file", "MoM_Master.db")
+
+LOG_COLUMNS = ["LogID", "TaskID", "Action", "Timestamp", "Actor", "Fields", "Notes"]
+
+
+class TaskLog:
+    """Persistent, append-only list of task events"""
+
+    def __init__(self, db_file=DB_FILE):
+        self.db_file = db_file
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS task_log (
+                    LogID INTEGER PRIMARY KEY AUTOINCREMENT,
+                    TaskID TEXT NOT NULL,
+                    Action TEXT NOT NULL,
+                    Timestamp TEXT NOT NULL,
+                    Actor TEXT,
+                    Fields TEXT,
+                    Notes TEXT,
+                    Compacted INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_task_log_taskid ON task_log (TaskID)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_task_log_pending ON task_log (Compacted) WHERE Compacted = 0")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_file, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # -----------------------------------------------------
+    # Append
+    # -----------------------------------------------------
+    def append(self, events):
+        """
+        Journal events: dicts with TaskID, Action and optionally Actor,
+        Fields (changed columns, folded in by compact()) and Notes
+
+        Events without Fields (created / deleted) are history only and
+        count as compacted straight away.
+        """
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows = [
+            (
+                str(event["TaskID"]), event["Action"], now,
+                event.get("Actor"),
+                json.dumps(event["Fields"], default=str) if event.get("Fields") else None,
+                event.get("Notes") or None,
+                0 if event.get("Fields") else 1,
+            )
+            for event in events
+        ]
+        if not rows:
+            return 0
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO task_log (TaskID, Action, Timestamp, Actor, Fields, Notes, Compacted) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
+
+    def record(self, task_id, action, actor=None, fields=None, notes=None):
+        """Journal one event"""
+        return self.append([{"TaskID": task_id, "Action": action, "Actor": actor, "Fields": fields, "Notes": notes}])
+
+    # -----------------------------------------------------
+    # Compaction
+    # -----------------------------------------------------
+    def compact(self, store=None):
+        """
+        Fold every uncompacted event into the Tasks table (last change per
+        column wins; a task deleted since simply matches no row), then mark
+        the events compacted. Returns the number of tasks updated.
+
+        If the store write fails the events stay pending and the next
+        compaction applies them. Compactions are serialized across
+        processes, so an older batch never lands after a newer one.
+        """
+        with file_lock(self.db_file):
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT LogID, TaskID, Fields FROM task_log WHERE Compacted = 0 ORDER BY LogID"
+                ).fetchall()
+            if not rows:
+                return 0
+
+            net = {}
+            for _, task_id, fields in rows:
+                net.setdefault(task_id, {}).update(json.loads(fields))
+
+            updated = (store or get_task_store()).update_tasks(net)
+            with self._connect() as conn:
+                conn.execute("UPDATE task_log SET Compacted = 1 WHERE Compacted = 0 AND LogID <= ?", (rows[-1][0],))
+        print(f"🗜️  Compacted {len(rows)} event(s) into {updated} task(s)")
+        return updated
+
+    # -----------------------------------------------------
+    # Queries
+    # -----------------------------------------------------
+    def _frame(self, where="", params=()):
+        columns = ", ".join(LOG_COLUMNS)
+        with self._connect() as conn:
+            return pd.read_sql_query(f"SELECT {columns} FROM task_log {where} ORDER BY LogID", conn, params=params)
+
+    def history(self, task_id):
+        """Every event of one task, oldest first"""
+        return self._frame("WHERE TaskID = ?", (str(task_id),))
+
+    def events(self, since_id=0):
+        """Events with LogID > since_id, oldest first"""
+        return self._frame("WHERE LogID > ?", (int(since_id),))
+
+    def pending_count(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM task_log WHERE Compacted = 0").fetchone()[0]
+
+    def export_excel(self, excel_path=MOM_FILE):
+        """Write the journal to the Logs sheet, keeping every other sheet"""
+        df = self.events().drop(columns=["Fields"])
+        write_sheet_atomic(excel_path, "Logs", df)
+        print(f"✅ Exported {len(df)} log event(s) to {excel_path}")
+        return len(df)
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "compact"
+    log = TaskLog()
+
+    if command == "compact":
+        log.compact()
+    elif command == "export":
+        log.export_excel(MOM_FILE)
+    else:
+        print(f"❌ Unknown command: {command} (use 'compact' or 'export')")
+        sys.exit(1)
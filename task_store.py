@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+TASK STORE
+- Single place that reads and mutates MoM tasks
+- SQLiteTaskStore: indexed table in WAL mode (default backend)
+- ExcelTaskStore: legacy whole-sheet read/rewrite of MoM_Master.xlsx
+  (deletes remove rows in place; rewrites retry when another process
+  committed the workbook in between)
+- Excel stays the import/export format for the SQLite backend
+
+Usage:
+    python task_store.py import   # MoM_Master.xlsx → SQLite
+    python task_store.py export   # SQLite → MoM_Master.xlsx (Tasks sheet)
+"""
+
+import os
+import re
+import sys
+import sqlite3
+from contextlib import contextmanager
+from datetime import date, datetime
+
+import pandas as pd
+import yaml
+
+from workbook_cache import parse_dates, read_sheet
+from workbook_io import delete_rows_atomic, retry_on_conflict, workbook_revision, write_sheet_atomic
+
+# ---------------------------------------------------------
+# Load config
+# ---------------------------------------------------------
+with open("config.yaml", "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+
+MOM_FILE = config["paths"]["mom_file"]
+STORAGE = config.get("storage", {})
+
+TASK_COLUMNS = [
+    "TaskID", "MeetingID", "Title", "Details", "Department",
+    "AssignedTo", "CreatedBy", "CreatedDate", "Deadline",
+    "Status", "LastUpdateDate", "LastUpdateBy", "Category"
+]
+
+DATE_COLUMNS = ["CreatedDate", "Deadline", "LastUpdateDate"]
+# Declared without a type in SQLite, so numeric IDs come back as numbers
+# (the reports compare them to user / meeting IDs, as read from the xlsx)
+UNTYPED_COLUMNS = ["MeetingID", "AssignedTo"]
+SEARCH_COLUMNS = ["TaskID", "Title", "AssignedTo", "Department"]
+DELETE_CHUNK = 500  # TaskIDs per DELETE ... IN (...) statement
+
+
+# ---------------------------------------------------------
+# Value helpers
+# ---------------------------------------------------------
+def _to_db_value(value):
+    """Convert a pandas/python value into something SQLite stores cleanly"""
+    if value is None:
+        return None
+    if isinstance(value, (pd.Timestamp, datetime, date)):
+        if pd.isna(value):
+            return None
+        return value.isoformat(sep=" ") if isinstance(value, datetime) else value.isoformat()
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    if hasattr(value, "item"):
+        # numpy scalar → python scalar
+        return value.item()
+    return value
+
+
+def _restore_number(value):
+    """'1086' → 1086 for IDs an older (all-TEXT) database stored as text"""
+    if isinstance(value, str) and re.fullmatch(r"\d+(\.0+)?", value.strip()):
+        return int(float(value))
+    return value
+
+
+def normalize_tasks(df):
+    """Give a Tasks frame the full column set and datetime64 date columns"""
+    df = df.copy()
+    df.columns = [str(c).strip() for c in df.columns]
+    for col in TASK_COLUMNS:
+        if col not in df.columns:
+            df[col] = None
+    for col in DATE_COLUMNS:
+        df[col] = parse_dates(df[col])
+    return df
+
+
+# ---------------------------------------------------------
+# Store interface
+# ---------------------------------------------------------
+class TaskStore:
+    """Interface every task backend implements"""
+
+    def load_tasks(self):
+        """Return all tasks as a DataFrame"""
+        raise NotImplementedError
+
+    def get_task(self, task_id):
+        """Return one task as a dict, or None"""
+        raise NotImplementedError
+
+    def add_task(self, task):
+        """Insert one task row (dict keyed by TASK_COLUMNS)"""
+        raise NotImplementedError
+
+    def add_tasks(self, tasks):
+        """Insert many task rows in a single write"""
+        raise NotImplementedError
+
+    def update_task(self, task_id, fields):
+        """Update columns of one task, returns True if the task exists"""
+        raise NotImplementedError
+
+    def update_tasks(self, updates):
+        """Apply {task_id: fields} in a single write, returns number of tasks updated"""
+        raise NotImplementedError
+
+    def delete_tasks(self, task_ids):
+        """Delete tasks by TaskID, returns number of rows removed"""
+        raise NotImplementedError
+
+    def delete_tasks_by_status(self, status):
+        """Delete every task with the given status, returns number removed"""
+        raise NotImplementedError
+
+    def query_tasks(self, search=None, statuses=None, departments=None, limit=50, offset=0):
+        """
+        One page of tasks matching the filters, in stored order
+        
+        Args:
+            search: case-insensitive substring of TaskID / Title / AssignedTo / Department
+            statuses: Status values to keep (case-insensitive; None = all)
+            departments: Department values to keep (None = all)
+            limit / offset: page window
+        
+        Returns:
+            (DataFrame, int): the page and the total number of matches
+        """
+        df = self.load_tasks()
+        mask = pd.Series(True, index=df.index)
+        if statuses is not None:
+            wanted = {str(s).strip().lower() for s in statuses}
+            mask &= df["Status"].astype(str).str.strip().str.lower().isin(wanted)
+        if departments is not None:
+            wanted = {str(d).strip() for d in departments}
+            mask &= df["Department"].astype(str).str.strip().isin(wanted)
+        if search:
+            hit = pd.Series(False, index=df.index)
+            for col in SEARCH_COLUMNS:
+                hit |= df[col].astype(str).str.contains(search, case=False, regex=False, na=False)
+            mask &= hit
+        matches = df[mask]
+        return matches.iloc[offset:offset + limit].reset_index(drop=True), len(matches)
+
+
+# ---------------------------------------------------------
+# SQLite backend
+# ---------------------------------------------------------
+class SQLiteTaskStore(TaskStore):
+    """Tasks in an indexed SQLite table (WAL mode)"""
+
+    def __init__(self, db_file):
+        self.db_file = db_file
+        self._init_db()
+
+    @contextmanager
+    def connect(self):
+        """Open a connection, commit on success, roll back on error"""
+        conn = sqlite3.connect(self.db_file, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        columns = ", ".join(
+            f'"{col}" TEXT PRIMARY KEY' if col == "TaskID"
+            else f'"{col}"' if col in UNTYPED_COLUMNS
+            else f'"{col}" TEXT'
+            for col in TASK_COLUMNS
+        )
+        with self.connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"CREATE TABLE IF NOT EXISTS tasks ({columns})")
+            # Bumped in the same transaction as every write to tasks, so
+            # other tables in this file (task_log) never change it
+            conn.execute("CREATE TABLE IF NOT EXISTS store_meta (Key TEXT PRIMARY KEY, Value INTEGER NOT NULL)")
+            conn.execute("INSERT OR IGNORE INTO store_meta VALUES ('tasks_revision', 0)")
+            conn.commit()
+            self._migrate_untyped(conn, columns)
+            for col in ["Status", "Department", "AssignedTo", "Deadline"]:
+                conn.execute(f'CREATE INDEX IF NOT EXISTS idx_tasks_{col.lower()} ON tasks ("{col}")')
+
+    def _migrate_untyped(self, conn, columns):
+        """Rebuild an all-TEXT tasks table with UNTYPED_COLUMNS as numbers again"""
+        conn.execute("BEGIN IMMEDIATE")  # one process migrates, the others see the result
+        declared = {row["name"]: row["type"] for row in conn.execute("PRAGMA table_info(tasks)")}
+        if not any(declared.get(col) for col in UNTYPED_COLUMNS):
+            conn.commit()
+            return
+        rows = conn.execute("SELECT * FROM tasks ORDER BY rowid").fetchall()
+        conn.execute(f"CREATE TABLE tasks_migrated ({columns})")
+        conn.executemany(
+            f"INSERT INTO tasks_migrated VALUES ({', '.join('?' for _ in TASK_COLUMNS)})",
+            [
+                [_restore_number(row[col]) if col in UNTYPED_COLUMNS else row[col] for col in TASK_COLUMNS]
+                for row in rows
+            ]
+        )
+        conn.execute("DROP TABLE tasks")
+        conn.execute("ALTER TABLE tasks_migrated RENAME TO tasks")
+        self._bump_revision(conn)
+        conn.commit()
+        print(f"🔧 Migrated {len(rows)} task(s): {', '.join(UNTYPED_COLUMNS)} stored as numbers")
+
+    @staticmethod
+    def _bump_revision(conn):
+        conn.execute("UPDATE store_meta SET Value = Value + 1 WHERE Key = 'tasks_revision'")
+
+    def revision(self):
+        """Counter that changes with every committed write to the tasks table"""
+        with self.connect() as conn:
+            return conn.execute("SELECT Value FROM store_meta WHERE Key = 'tasks_revision'").fetchone()[0]
+
+    def is_empty(self):
+        with self.connect() as conn:
+            return conn.execute("SELECT 1 FROM tasks LIMIT 1").fetchone() is None
+
+    def load_tasks(self):
+        with self.connect() as conn:
+            df = pd.read_sql_query("SELECT * FROM tasks ORDER BY rowid", conn)
+        return normalize_tasks(df)
+
+    def get_task(self, task_id):
+        with self.connect() as conn:
+            row = conn.execute("SELECT * FROM tasks WHERE TaskID = ?", (str(task_id),)).fetchone()
+        return dict(row) if row else None
+
+    def query_tasks(self, search=None, statuses=None, departments=None, limit=50, offset=0):
+        clauses, params = [], []
+        if statuses is not None:
+            wanted = [str(s).strip().lower() for s in statuses] or [None]
+            clauses.append(f"LOWER(TRIM(Status)) IN ({', '.join('?' for _ in wanted)})")
+            params += wanted
+        if departments is not None:
+            wanted = [str(d).strip() for d in departments] or [None]
+            clauses.append(f"TRIM(Department) IN ({', '.join('?' for _ in wanted)})")
+            params += wanted
+        if search:
+            pattern = "%" + search.replace("!", "!!").replace("%", "!%").replace("_", "!_") + "%"
+            clauses.append("(" + " OR ".join(f"{col} LIKE ? ESCAPE '!'" for col in SEARCH_COLUMNS) + ")")
+            params += [pattern] * len(SEARCH_COLUMNS)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self.connect() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM tasks {where}", params).fetchone()[0]
+            df = pd.read_sql_query(
+                f"SELECT * FROM tasks {where} ORDER BY rowid LIMIT ? OFFSET ?",
+                conn, params=params + [int(limit), int(offset)]
+            )
+        return normalize_tasks(df), total
+
+    def add_task(self, task):
+        self.add_tasks([task])
+
+    def add_tasks(self, tasks):
+        rows = [[_to_db_value(task.get(col)) for col in TASK_COLUMNS] for task in tasks]
+        if not rows:
+            return
+        placeholders = ", ".join("?" for _ in TASK_COLUMNS)
+        names = ", ".join(f'"{col}"' for col in TASK_COLUMNS)
+        with self.connect() as conn:
+            conn.executemany(f"INSERT INTO tasks ({names}) VALUES ({placeholders})", rows)
+            self._bump_revision(conn)
+
+    def update_task(self, task_id, fields):
+        fields = {k: v for k, v in fields.items() if k in TASK_COLUMNS and k != "TaskID"}
+        if not fields:
+            return self.get_task(task_id) is not None
+        return self.update_tasks({task_id: fields}) > 0
+
+    def update_tasks(self, updates):
+        updated = 0
+        with self.connect() as conn:
+            for task_id, fields in updates.items():
+                fields = {k: v for k, v in fields.items() if k in TASK_COLUMNS and k != "TaskID"}
+                if not fields:
+                    continue
+                assignments = ", ".join(f'"{col}" = ?' for col in fields)
+                values = [_to_db_value(v) for v in fields.values()] + [str(task_id)]
+                updated += conn.execute(f"UPDATE tasks SET {assignments} WHERE TaskID = ?", values).rowcount
+            if updated:
+                self._bump_revision(conn)
+        return updated
+
+    def delete_tasks(self, task_ids):
+        ids = list(dict.fromkeys(str(t) for t in task_ids))
+        deleted = 0
+        with self.connect() as conn:
+            for i in range(0, len(ids), DELETE_CHUNK):
+                chunk = ids[i:i + DELETE_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                deleted += conn.execute(f"DELETE FROM tasks WHERE TaskID IN ({placeholders})", chunk).rowcount
+            if deleted:
+                self._bump_revision(conn)
+        return deleted
+
+    def delete_tasks_by_status(self, status):
+        with self.connect() as conn:
+            cur = conn.execute("DELETE FROM tasks WHERE Status = ?", (status,))
+            if cur.rowcount:
+                self._bump_revision(conn)
+            return cur.rowcount
+
+    # -----------------------------------------------------
+    # Excel import / export
+    # -----------------------------------------------------
+    def import_excel(self, excel_path=MOM_FILE):
+        """Replace the table contents with the Tasks sheet of the workbook"""
+        df = normalize_tasks(pd.read_excel(excel_path, sheet_name="Tasks"))
+        df = df[df["TaskID"].notna()].drop_duplicates(subset="TaskID", keep="last")
+        rows = [
+            [_to_db_value(v) for v in row]
+            for row in df[TASK_COLUMNS].astype(object).itertuples(index=False, name=None)
+        ]
+        placeholders = ", ".join("?" for _ in TASK_COLUMNS)
+        with self.connect() as conn:
+            conn.execute("DELETE FROM tasks")
+            conn.executemany(f"INSERT INTO tasks VALUES ({placeholders})", rows)
+            self._bump_revision(conn)
+        print(f"✅ Imported {len(rows)} task(s) from {excel_path}")
+        return len(rows)
+
+    def export_excel(self, excel_path=MOM_FILE):
+        """Write the table to the Tasks sheet, keeping every other sheet"""
+        df = self.load_tasks()[TASK_COLUMNS]
+        write_sheet_atomic(excel_path, "Tasks", df)
+        print(f"✅ Exported {len(df)} task(s) to {excel_path}")
+        return len(df)
+
+
+# ---------------------------------------------------------
+# Excel backend (legacy)
+# ---------------------------------------------------------
+class ExcelTaskStore(TaskStore):
+    """Tasks kept directly in the Tasks sheet; adds and updates rewrite the sheet, deletes remove rows in place"""
+
+    def __init__(self, excel_path):
+        self.excel_path = excel_path
+
+    def _read(self):
+        # Served from the snapshot cache until the workbook changes
+        return normalize_tasks(read_sheet("Tasks", self.excel_path))
+
+    def _modify(self, change):
+        """
+        Read → change(df) → write, re-run from a fresh read whenever another
+        writer committed the workbook in between
+
+        `change` returns (new frame or None to skip the write, result).
+        """
+        def attempt():
+            revision = workbook_revision(self.excel_path)
+            df, result = change(self._read())
+            if df is not None:
+                write_sheet_atomic(self.excel_path, "Tasks", df, expected_revision=revision)
+            return result
+        return retry_on_conflict(attempt, self.excel_path)
+
+    def load_tasks(self):
+        return self._read()
+
+    def get_task(self, task_id):
+        df = self._read()
+        match = df[df["TaskID"].astype(str) == str(task_id)]
+        return match.iloc[0].to_dict() if not match.empty else None
+
+    def add_task(self, task):
+        self.add_tasks([task])
+
+    def add_tasks(self, tasks):
+        tasks = list(tasks)
+        if not tasks:
+            return
+        self._modify(lambda df: (pd.concat([df, pd.DataFrame(tasks)], ignore_index=True), None))
+
+    def update_task(self, task_id, fields):
+        return self.update_tasks({task_id: fields}) > 0
+
+    def update_tasks(self, updates):
+        if not updates:
+            return 0
+
+        def change(df):
+            ids = df["TaskID"].astype(str)
+            updated = 0
+            for task_id, fields in updates.items():
+                idx = df[ids == str(task_id)].index
+                if len(idx) == 0:
+                    continue
+                for col, value in fields.items():
+                    if col in df.columns and df[col].dtype != object:
+                        df[col] = df[col].astype(object)
+                    df.loc[idx, col] = value
+                updated += 1
+            return (df if updated else None), updated
+
+        return self._modify(change)
+
+    def delete_tasks(self, task_ids):
+        return delete_rows_atomic(self.excel_path, "Tasks", "TaskID", task_ids)
+
+    def delete_tasks_by_status(self, status):
+        return delete_rows_atomic(self.excel_path, "Tasks", "Status", [status])
+
+
+# ---------------------------------------------------------
+# Factory
+# ---------------------------------------------------------
+_store = None
+
+
+def get_task_store():
+    """Return the process-wide store selected by config storage.backend"""
+    global _store
+    if _store is not None:
+        return _store
+
+    backend = STORAGE.get("backend", "sqlite")
+    if backend == "excel":
+        _store = ExcelTaskStore(MOM_FILE)
+    elif backend == "sqlite":
+        _store = SQLiteTaskStore(STORAGE.get("db_file", "MoM_Master.db"))
+        # First run: seed the database from the workbook
+        if _store.is_empty() and os.path.exists(MOM_FILE):
+            try:
+                _store.import_excel(MOM_FILE)
+            except Exception as e:
+                print(f"⚠️  Could not import tasks from {MOM_FILE}: {e}")
+    else:
+        raise ValueError(f"Unknown storage backend: {backend}")
+    return _store
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "export"
+    store = get_task_store()
+
+    if not isinstance(store, SQLiteTaskStore):
+        print("ℹ️  storage.backend is 'excel' - nothing to import/export")
+    elif command == "import":
+        store.import_excel(MOM_FILE)
+    elif command == "export":
+        store.export_excel(MOM_FILE)
+    else:
+        print(f"❌ Unknown command: {command} (use 'import' or 'export')")
+        sys.exit(1)
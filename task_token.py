@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+TASK TOKENS FOR MAIL ROUTING
+- Every task mail carries its TaskID three ways:
+  subject token "[MoM:TASK-1A2B3C4D]", header X-MoM-Task-ID, and a
+  Message-ID of the form <...mom.TASK-1A2B3C4D@domain>
+- Replies quote the Message-ID in In-Reply-To / References, so the reply
+  processor can route them without any title lookup
+- X-MoM-Task-ID is never copied into replies by mail clients: a message
+  carrying it is the system's own mail, not a reply
+"""
+
+import re
+from email.utils import make_msgid
+
+TASK_HEADER = "X-MoM-Task-ID"
+
+_SAFE_ID = re.compile(r"[A-Za-z0-9_\-]+")
+_SUBJECT_TOKEN = re.compile(r"\[MoM:([A-Za-z0-9_\-]+)\]", re.IGNORECASE)
+_LEGACY_TOKEN = re.compile(r"\[Task-#?(\d+)\]", re.IGNORECASE)
+_MESSAGE_ID_TOKEN = re.compile(r"\.mom\.([A-Za-z0-9_\-]+)@", re.IGNORECASE)
+
+
+def subject_token(task_id):
+    return f"[MoM:{task_id}]"
+
+
+def tag_subject(subject, task_id):
+    """Append the task token to a subject (once)"""
+    if not _SAFE_ID.fullmatch(str(task_id)) or _SUBJECT_TOKEN.search(subject):
+        return subject
+    return f"{subject} {subject_token(task_id)}"
+
+
+def strip_subject_token(subject):
+    return _SUBJECT_TOKEN.sub("", subject or "").strip()
+
+
+def task_message_id(task_id, sender):
+    """Message-ID that encodes the TaskID"""
+    domain = str(sender or "").rpartition("@")[2] or None
+    if not _SAFE_ID.fullmatch(str(task_id)):
+        return make_msgid(domain=domain)
+    return make_msgid(idstring=f"mom.{task_id}", domain=domain)
+
+
+def tag_message(msg, task_id):
+    """Add subject token, X-MoM-Task-ID header and a task Message-ID to `msg`"""
+    task_id = str(task_id)
+    subject = msg["Subject"] or ""
+    del msg["Subject"]
+    msg["Subject"] = tag_subject(subject, task_id)
+    del msg[TASK_HEADER]
+    msg[TASK_HEADER] = task_id
+    del msg["Message-ID"]
+    msg["Message-ID"] = task_message_id(task_id, msg["From"])
+    return msg
+
+
+def task_id_from_subject(subject):
+    """TaskID from "[MoM:TASK-…]" (or the legacy "[Task-#123]") in a subject, or None"""
+    match = _SUBJECT_TOKEN.search(subject or "")
+    if match:
+        return match.group(1)
+    match = _LEGACY_TOKEN.search(subject or "")
+    return match.group(1) if match else None
+
+
+def is_task_mail(headers):
+    """True for mail sent by the system itself (it carries X-MoM-Task-ID)"""
+    return bool((headers.get(TASK_HEADER) or "").strip())
+
+
+def task_id_from_headers(headers):
+    """TaskID from reply headers: In-Reply-To, then References (newest first)"""
+    match = _MESSAGE_ID_TOKEN.search(str(headers.get("In-Reply-To") or ""))
+    if match:
+        return match.group(1)
+    references = _MESSAGE_ID_TOKEN.findall(str(headers.get("References") or ""))
+    return references[-1] if references else None
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Replies are told apart from the system's own mail by the X-MoM-Task-ID
+header, so the owner's replies from the SMTP_USER address still update tasks
+
+Usage: python -m pytest test_system_mail.py   (or python test_system_mail.py)
+"""
+
+import os
+import tempfile
+from email.message import Message
+
+import email_reply_processor
+from email_engine import build_message
+from email_reply_processor import TaskUpdateBatch, is_system_mail, process_reply
+from task_log import TaskLog
+from task_store import SQLiteTaskStore
+
+OWNER = "mom-bot@example.com"
+
+
+class _Queue:
+    def __init__(self):
+        self.messages = []
+
+    def enqueue_message(self, msg):
+        self.messages.append(msg)
+
+
+def _record(msg, body):
+    return {
+        'uid': 1,
+        'message_id': msg.get('Message-ID') or '<reply@example.com>',
+        'subject': msg['Subject'],
+        'from': msg['From'],
+        'headers': msg,
+        'body': body,
+    }
+
+
+def _reply_from_owner(task_mail):
+    reply = Message()
+    reply['From'] = OWNER
+    reply['To'] = OWNER
+    reply['Subject'] = f"Re: {task_mail['Subject']}"
+    reply['In-Reply-To'] = task_mail['Message-ID']
+    reply['References'] = task_mail['Message-ID']
+    return reply
+
+
+def test_owner_reply_from_smtp_user_is_processed():
+    email_reply_processor.SMTP_USER = OWNER
+    task_mail = build_message(OWNER, OWNER, "New MoM Task Assigned: Ship report", "Please ship it", task_id="T-1")
+    reply = _reply_from_owner(task_mail)
+
+    assert is_system_mail(_record(task_mail, "Please ship it"))
+    assert not is_system_mail(_record(reply, "completed"))
+
+    with tempfile.TemporaryDirectory() as scratch:
+        store = SQLiteTaskStore(os.path.join(scratch, "tasks.db"))
+        store.add_tasks([{"TaskID": "T-1", "Title": "Ship report", "Status": "pending", "AssignedTo": OWNER}])
+        batch = TaskUpdateBatch(store=store, log=TaskLog(os.path.join(scratch, "log.db")))
+        queue = _Queue()
+
+        assert not process_reply(_record(task_mail, "Task completed"), queue, batch)
+        assert process_reply(_record(reply, "I have completed this task."), queue, batch)
+        assert batch.get("T-1")["Status"] == "completed"
+        assert len(queue.messages) == 1
+
+
+if __name__ == "__main__":
+    test_owner_reply_from_smtp_user_is_processed()
+    print("✅ system mail tests passed")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Numeric IDs read back through the SQLite task store keep their type, so
+report filters such as tasks["AssignedTo"] == user_id still match
+
+Usage: python -m pytest test_task_store_types.py   (or python test_task_store_types.py)
+"""
+
+import numbers
+import os
+import sqlite3
+import tempfile
+
+from task_store import TASK_COLUMNS, SQLiteTaskStore
+
+
+def _task(**fields):
+    return {"TaskID": "T-1", "Title": "Typed IDs", "Status": "pending", **fields}
+
+
+def test_integer_ids_come_back_as_numbers():
+    with tempfile.TemporaryDirectory() as scratch:
+        store = SQLiteTaskStore(os.path.join(scratch, "tasks.db"))
+        store.add_tasks([_task(AssignedTo=1086, MeetingID=1)])
+
+        tasks = store.load_tasks()
+        assert isinstance(tasks.loc[0, "AssignedTo"], numbers.Integral)
+        assert len(tasks[tasks["AssignedTo"] == 1086]) == 1
+        assert len(tasks[tasks["AssignedTo"].isin([1086, 2001])]) == 1
+        assert len(tasks[tasks["MeetingID"] == 1]) == 1
+
+        page, _total = store.query_tasks()
+        assert len(page[page["AssignedTo"] == 1086]) == 1
+        assert store.get_task("T-1")["MeetingID"] == 1
+
+
+def test_text_ids_stay_text():
+    with tempfile.TemporaryDirectory() as scratch:
+        store = SQLiteTaskStore(os.path.join(scratch, "tasks.db"))
+        store.add_tasks([_task(AssignedTo="Aditya", MeetingID="BOSS-7")])
+
+        task = store.get_task("T-1")
+        assert task["AssignedTo"] == "Aditya"
+        assert task["MeetingID"] == "BOSS-7"
+
+
+def test_all_text_database_is_migrated():
+    with tempfile.TemporaryDirectory() as scratch:
+        db_file = os.path.join(scratch, "tasks.db")
+        conn = sqlite3.connect(db_file)
+        columns = ", ".join(f'"{col}" TEXT' for col in TASK_COLUMNS)
+        conn.execute(f"CREATE TABLE tasks ({columns})")
+        conn.execute('INSERT INTO tasks ("TaskID", "AssignedTo", "MeetingID") VALUES (?, ?, ?)', ("T-1", "1086", "1"))
+        conn.commit()
+        conn.close()
+
+        store = SQLiteTaskStore(db_file)
+        task = store.get_task("T-1")
+        assert task["AssignedTo"] == 1086
+        assert task["MeetingID"] == 1
+        assert store.revision() == 1
+
+
+if __name__ == "__main__":
+    test_integer_ids_come_back_as_numbers()
+    test_text_ids_stay_text()
+    test_all_text_database_is_migrated()
+    print("✅ Task store keeps numeric IDs numeric")
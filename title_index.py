@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+TASK TITLE INDEX
+- Normalized title → TaskIDs hash index for O(1) reply-to-task matching
+- Normalization: Re:/Fwd:/RE:/FW: prefixes, emoji / symbols, case and
+  whitespace are ignored
+- Trigram index as a fuzzy fallback for slightly edited subjects
+- Built once per run from the task table and reused for every email
+"""
+
+import re
+import unicodedata
+from collections import Counter, defaultdict
+
+REPLY_PREFIX = re.compile(r'^\s*((re|fw|fwd|aw|wg)\s*(\[\d+\])?\s*:\s*)+', re.IGNORECASE)
+
+# When several tasks share a title, open ones are matched before these
+CLOSED_STATUSES = {"completed", "cancelled"}
+
+
+def strip_reply_prefixes(subject):
+    """'Re: Fwd: RE: title' → 'title'"""
+    return REPLY_PREFIX.sub('', str(subject or ''))
+
+
+def normalize_title(text):
+    """Comparable form of a title: no reply prefixes, emoji, case or extra whitespace"""
+    text = unicodedata.normalize('NFKC', strip_reply_prefixes(text))
+    # Drop emoji / symbols / control characters (categories S* and C*)
+    text = ''.join(
+        ch if unicodedata.category(ch)[0] not in 'SC' else ' '
+        for ch in text
+    )
+    return ' '.join(text.casefold().split())
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TitleIndex:
+    """Exact + trigram lookup of tasks by title"""
+
+    def __init__(self, tasks, min_similarity=0.6):
+        """
+        Args:
+            tasks: task DataFrame (TaskID, Title, Status columns)
+            min_similarity: Dice coefficient a fuzzy match must reach
+        """
+        self.min_similarity = min_similarity
+        self.exact = defaultdict(list)
+        self._titles = []
+        self._grams = defaultdict(list)
+
+        ids = tasks['TaskID'].astype(str).tolist()
+        titles = tasks['Title'].map(normalize_title).tolist()
+        statuses = (
+            tasks['Status'].astype(str).str.strip().str.lower().tolist()
+            if 'Status' in tasks.columns else [''] * len(ids)
+        )
+
+        for task_id, title, status in zip(ids, titles, statuses):
+            if not title:
+                continue
+            self.exact[title].append((status in CLOSED_STATUSES, task_id))
+
+        # Open tasks first, then the most recently added one
+        for title, entries in self.exact.items():
+            order = sorted(range(len(entries)), key=lambda i: (entries[i][0], -i))
+            self.exact[title] = [entries[i][1] for i in order]
+
+        for title in self.exact:
+            pos = len(self._titles)
+            self._titles.append(title)
+            for gram in trigrams(title):
+                self._grams[gram].append(pos)
+
+    def __len__(self):
+        return len(self._titles)
+
+    def lookup(self, title):
+        """All TaskIDs with exactly this (normalized) title, best candidate first"""
+        return list(self.exact.get(normalize_title(title), []))
+
+    def fuzzy(self, title):
+        """(TaskID, similarity) of the closest title, or None below min_similarity"""
+        title = normalize_title(title)
+        if not title:
+            return None
+        grams = trigrams(title)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._grams.get(gram, ()))
+        if not shared:
+            return None
+
+        best_pos, best_score = None, 0.0
+        for pos, count in shared.most_common(20):
+            score = 2 * count / (len(grams) + len(trigrams(self._titles[pos])))
+            if score > best_score:
+                best_pos, best_score = pos, score
+
+        if best_score < self.min_similarity:
+            return None
+        return self.exact[self._titles[best_pos]][0], best_score
+
+    def match(self, title):
+        """Best TaskID for a title: exact hit first, then the fuzzy fallback"""
+        ids = self.lookup(title)
+        if ids:
+            return ids[0]
+        hit = self.fuzzy(title)
+        return hit[0] if hit else None
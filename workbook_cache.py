@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+WORKBOOK SNAPSHOT CACHE
+- Parsing MoM_Master.xlsx with openpyxl is the slowest step of every run
+- The first read materializes every sheet to Parquet (pickle if pyarrow
+  is not installed) under storage.snapshot_dir
+- Snapshots are keyed by the workbook's mtime + size, so any write to the
+  xlsx invalidates them automatically
+- Each snapshot records a content fingerprint per sheet, so callers can
+  tell which sheets a workbook write actually changed (sheet_versions)
+- Columns come back typed: datetime64 dates, categorical Status/Department
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+
+import pandas as pd
+import yaml
+
+try:
+    import pyarrow  # noqa: F401
+    SNAPSHOT_FORMAT = "parquet"
+except ImportError:
+    SNAPSHOT_FORMAT = "pickle"
+
+# ---------------------------------------------------------
+# Load config
+# ---------------------------------------------------------
+with open("config.yaml", "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+
+MOM_FILE = config["paths"]["mom_file"]
+SNAPSHOT_DIR = config.get("storage", {}).get("snapshot_dir", ".mom_cache")
+
+DATE_COLUMNS = ["CreatedDate", "Deadline", "LastUpdateDate", "Date", "Timestamp"]
+CATEGORY_COLUMNS = ["Status", "Department"]
+
+
+# ---------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------
+def workbook_signature(excel_path=MOM_FILE):
+    """Short hash of the workbook's inode + mtime + size (new on every commit)"""
+    stat = os.stat(excel_path)
+    raw = f"{os.path.abspath(excel_path)}:{stat.st_ino}:{stat.st_mtime_ns}:{stat.st_size}"
+    return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+def parse_dates(values):
+    """to_datetime that accepts mixed formats ("2026-01-01" next to full timestamps)"""
+    return pd.to_datetime(values, errors="coerce", format="mixed")
+
+
+def type_columns(df):
+    """Strip headers, parse date columns, make Status/Department categorical"""
+    df.columns = [str(c).strip() for c in df.columns]
+    for col in DATE_COLUMNS:
+        if col in df.columns:
+            df[col] = parse_dates(df[col])
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _arrow_safe(df):
+    """One type per column (Parquet needs it): stringify mixed object columns"""
+    df = df.copy()
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        values = df[col].dropna()
+        if values.map(type).nunique() > 1:
+            df[col] = df[col].astype(str).where(df[col].notna())
+    return df
+
+
+def _sheet_file(snapshot_path, index):
+    ext = "parquet" if SNAPSHOT_FORMAT == "parquet" else "pkl"
+    return os.path.join(snapshot_path, f"sheet_{index}.{ext}")
+
+
+def _fingerprint(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()[:16]
+
+
+def _snapshot_root(excel_path):
+    stem = os.path.splitext(os.path.basename(excel_path))[0]
+    return os.path.join(SNAPSHOT_DIR, stem)
+
+
+# ---------------------------------------------------------
+# Snapshot read / write
+# ---------------------------------------------------------
+def _write_snapshot(snapshot_path, sheets):
+    """Write all sheets to a temp dir, then rename it into place"""
+    root = os.path.dirname(snapshot_path)
+    os.makedirs(root, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=root, prefix=".tmp-")
+    try:
+        names = list(sheets)
+        for i, name in enumerate(names):
+            if SNAPSHOT_FORMAT == "parquet":
+                sheets[name].to_parquet(_sheet_file(tmp, i), index=False)
+            else:
+                sheets[name].to_pickle(_sheet_file(tmp, i))
+        with open(os.path.join(tmp, "sheets.txt"), "w", encoding="utf-8") as f:
+            f.write("\n".join(names))
+        with open(os.path.join(tmp, "fingerprints.txt"), "w", encoding="utf-8") as f:
+            f.write("\n".join(_fingerprint(_sheet_file(tmp, i)) for i in range(len(names))))
+        os.rename(tmp, snapshot_path)
+    except OSError:
+        # Another process won the race - its snapshot is just as good
+        shutil.rmtree(tmp, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+    # Drop snapshots of older workbook versions
+    for entry in os.listdir(root):
+        path = os.path.join(root, entry)
+        if path != snapshot_path and not entry.startswith(".tmp-"):
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def _read_snapshot(snapshot_path, sheet_names=None):
+    with open(os.path.join(snapshot_path, "sheets.txt"), "r", encoding="utf-8") as f:
+        names = f.read().split("\n")
+    wanted = names if sheet_names is None else [n for n in sheet_names if n in names]
+    sheets = {}
+    for name in wanted:
+        path = _sheet_file(snapshot_path, names.index(name))
+        if SNAPSHOT_FORMAT == "parquet":
+            sheets[name] = type_columns(pd.read_parquet(path))
+        else:
+            sheets[name] = pd.read_pickle(path)
+    return sheets
+
+
+def read_sheets(sheet_names=None, excel_path=MOM_FILE):
+    """
+    Read sheets of the workbook, served from the snapshot when it is current
+
+    Args:
+        sheet_names: list of sheet names (None = all sheets)
+        excel_path: workbook path
+
+    Returns:
+        dict: sheet name → DataFrame (missing sheets are left out)
+    """
+    snapshot_path = os.path.join(_snapshot_root(excel_path), workbook_signature(excel_path))
+
+    if os.path.isdir(snapshot_path):
+        try:
+            return _read_snapshot(snapshot_path, sheet_names)
+        except Exception as e:
+            print(f"⚠️  Snapshot unreadable, re-reading {excel_path}: {e}")
+            shutil.rmtree(snapshot_path, ignore_errors=True)
+
+    # One openpyxl parse for every sheet, then snapshot them all
+    sheets = {
+        name: _arrow_safe(type_columns(df))
+        for name, df in pd.read_excel(excel_path, sheet_name=None).items()
+    }
+    try:
+        _write_snapshot(snapshot_path, sheets)
+    except Exception as e:
+        print(f"⚠️  Could not write workbook snapshot: {e}")
+
+    if sheet_names is None:
+        return sheets
+    return {name: sheets[name] for name in sheet_names if name in sheets}
+
+
+def _read_fingerprints(snapshot_path):
+    with open(os.path.join(snapshot_path, "sheets.txt"), "r", encoding="utf-8") as f:
+        names = f.read().split("\n")
+    try:
+        with open(os.path.join(snapshot_path, "fingerprints.txt"), "r", encoding="utf-8") as f:
+            prints = f.read().split("\n")
+    except FileNotFoundError:
+        # Snapshot written before fingerprints existed
+        prints = [_fingerprint(_sheet_file(snapshot_path, i)) for i in range(len(names))]
+    return dict(zip(names, prints))
+
+
+_versions = {}
+
+
+def sheet_versions(excel_path=MOM_FILE):
+    """
+    Content fingerprint of every sheet in the workbook
+
+    A sheet's fingerprint only changes when its cells change, so a write
+    to the Escalations sheet leaves the Users fingerprint as it was.
+    Builds the snapshot if the workbook changed since the last one.
+    """
+    signature = workbook_signature(excel_path)
+    key = os.path.abspath(excel_path)
+    if _versions.get(key, (None,))[0] != signature:
+        snapshot_path = os.path.join(_snapshot_root(excel_path), signature)
+        if not os.path.isdir(snapshot_path):
+            read_sheets([], excel_path)
+        try:
+            _versions[key] = (signature, _read_fingerprints(snapshot_path))
+        except OSError:
+            # Snapshot could not be written: every sheet counts as changed
+            return {name: signature for name in read_sheets(None, excel_path)}
+    return _versions[key][1]
+
+
+def read_sheet(sheet_name, excel_path=MOM_FILE):
+    """Read one sheet (empty DataFrame if it does not exist)"""
+    return read_sheets([sheet_name], excel_path).get(sheet_name, pd.DataFrame())
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+CRASH-SAFE WORKBOOK WRITES
+- Every write goes to a temp file next to MoM_Master.xlsx, is fsync'd and
+  then swapped in with os.replace()
+- A crash mid-write leaves the previous workbook intact instead of a
+  truncated zip
+- delete_rows_atomic removes rows by key in place with openpyxl: one scan
+  of the key column, one compaction pass, other rows and sheets untouched
+- Commits hold a cross-process lock (<file>.lock), so the dashboard, the
+  reply processor and the cron jobs never interleave writes
+- Read-modify-write callers pass the workbook_revision() they read; the
+  commit raises WriteConflict if another process committed in between,
+  and retry_on_conflict() re-runs the whole read → modify → commit
+  (the last retry under the lock)
+"""
+
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from copy import copy
+
+import openpyxl
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+LOCK_TIMEOUT = 60  # seconds to wait for another writer
+CONFLICT_RETRIES = 8
+
+
+class WriteConflict(Exception):
+    """The workbook was committed by someone else since it was read"""
+
+
+# ---------------------------------------------------------
+# Locking / revisions
+# ---------------------------------------------------------
+_held = threading.local()
+
+
+def _try_lock(f):
+    if fcntl:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+
+
+def _unlock(f):
+    if fcntl:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(path, timeout=LOCK_TIMEOUT):
+    """
+    Exclusive cross-process lock for `path`, held on `path`.lock
+
+    Re-entrant within a thread; other threads and processes wait up to
+    `timeout` seconds, then TimeoutError is raised.
+    """
+    key = os.path.abspath(path)
+    held = _held.__dict__.setdefault("paths", set())
+    if key in held:
+        yield
+        return
+
+    with open(key + ".lock", "a+b") as f:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                _try_lock(f)
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for the lock on {path}")
+                time.sleep(random.uniform(0.01, 0.05))
+        held.add(key)
+        try:
+            yield
+        finally:
+            held.discard(key)
+            _unlock(f)
+
+
+def workbook_revision(path):
+    """
+    Identity of the committed workbook, or None if it does not exist
+
+    Every commit swaps in a new file (os.replace), so inode + mtime + size
+    change with each write.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _check_revision(path, expected_revision):
+    if expected_revision is not None and workbook_revision(path) != expected_revision:
+        raise WriteConflict(f"{path} was changed by another writer")
+
+
+def retry_on_conflict(attempt, path, retries=CONFLICT_RETRIES):
+    """
+    Run `attempt()` (read → modify → commit with expected_revision) until
+    it commits without a WriteConflict, backing off with jitter
+
+    The last try holds the lock on `path` for the whole read → commit, so
+    a writer that keeps losing the race still gets through.
+    """
+    for i in range(retries - 1):
+        try:
+            return attempt()
+        except WriteConflict:
+            time.sleep(random.uniform(0, 0.02 * 2 ** i))
+    with file_lock(path):
+        return attempt()
+
+
+# ---------------------------------------------------------
+# Commits
+# ---------------------------------------------------------
+
+
+def _temp_path(path):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".~", suffix=os.path.splitext(path)[1])
+    os.close(fd)
+    return tmp
+
+
+def _commit(tmp, path):
+    if os.path.exists(path):
+        shutil.copymode(path, tmp)
+    with open(tmp, "rb+") as f:
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def atomic_save_workbook(wb, path, expected_revision=None):
+    """
+    Save an openpyxl Workbook via temp file + rename, under the file lock
+
+    `expected_revision`: workbook_revision() at the time `wb` was loaded;
+    WriteConflict is raised instead of overwriting a newer commit.
+    """
+    with file_lock(path):
+        _check_revision(path, expected_revision)
+        tmp = _temp_path(path)
+        try:
+            wb.save(tmp)
+            _commit(tmp, path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+
+def write_sheet_atomic(path, sheet_name, df, expected_revision=None):
+    """
+    Replace one sheet (keeping the others) via temp file + rename, under
+    the file lock (see atomic_save_workbook for `expected_revision`)
+    """
+    with file_lock(path):
+        _check_revision(path, expected_revision)
+        tmp = _temp_path(path)
+        try:
+            if os.path.exists(path):
+                shutil.copy2(path, tmp)
+                with pd.ExcelWriter(tmp, engine="openpyxl", mode="a", if_sheet_exists="replace") as writer:
+                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+            else:
+                df.to_excel(tmp, sheet_name=sheet_name, index=False)
+            _commit(tmp, path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+
+def _cell_key(value):
+    """Cell value as a comparable string (2.0 → '2', None → None)"""
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def _compact_rows(ws, doomed):
+    """
+    Drop the rows in `doomed` (sorted row numbers) by moving later rows up
+    once; a moved cell keeps its value, style, hyperlink and comment
+    """
+    write_row = doomed[0]
+    doomed = set(doomed)
+    max_col = ws.max_column
+    for row in range(write_row, ws.max_row + 1):
+        if row in doomed:
+            continue
+        if row != write_row:
+            for col in range(1, max_col + 1):
+                src, dst = ws.cell(row, col), ws.cell(write_row, col)
+                dst.value = src.value
+                dst._style = copy(src._style)
+                dst.hyperlink = copy(src.hyperlink)
+                dst.comment = copy(src.comment)
+            ws.row_dimensions[write_row].height = ws.row_dimensions[row].height
+        write_row += 1
+    ws.delete_rows(write_row, ws.max_row - write_row + 1)
+
+
+def delete_rows_atomic(path, sheet_name, column, values):
+    """
+    Delete the rows of `sheet_name` whose `column` value is in `values`
+
+    Rows are matched on their string value (so TaskID 12 matches "12").
+    Thousands of keys cost one pass over the sheet, not one per key.
+
+    Returns:
+        int: number of rows deleted (the workbook is not written if 0)
+    """
+    keys = {_cell_key(v) for v in values} - {None}
+    if not keys or not os.path.exists(path):
+        return 0
+
+    # Pessimistic: the rows are located and removed inside the lock
+    with file_lock(path):
+        wb = openpyxl.load_workbook(path)
+        if sheet_name not in wb.sheetnames:
+            return 0
+        ws = wb[sheet_name]
+        header = [_cell_key(c.value) for c in ws[1]]
+        if column not in header:
+            return 0
+        col = header.index(column) + 1
+
+        doomed = [
+            row for row, (value,) in enumerate(
+                ws.iter_rows(min_row=2, min_col=col, max_col=col, values_only=True), start=2
+            )
+            if _cell_key(value) in keys
+        ]
+        if not doomed:
+            return 0
+
+        if len(doomed) == doomed[-1] - doomed[0] + 1:
+            # One contiguous block
+            ws.delete_rows(doomed[0], len(doomed))
+        else:
+            _compact_rows(ws, doomed)
+        atomic_save_workbook(wb, path)
+    return len(doomed)